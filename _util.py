@@ -0,0 +1,18 @@
+"""Helpers shared by the calendar service modules."""
+from operator import itemgetter
+from typing import List
+
+try:
+    import orjson # Optional: a much faster JSON decoder for API responses
+except ImportError:
+    orjson = None
+
+_get_email = itemgetter('email')
+
+def attendee_emails(attendees) -> List[str]:
+    """Returns the attendees' email addresses, skipping entries without one."""
+    try:
+        # Every attendee normally has an email, so extract them all in C first
+        return list(map(_get_email, attendees))
+    except KeyError:
+        return [att['email'] for att in attendees if 'email' in att]
@@ -1,5 +1,9 @@
 import keyring
+import keyring.errors
 import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 # A unique service name for our application to store credentials under.
 SERVICE_NAME = "ChronoAI"
@@ -11,7 +15,13 @@ class AuthManager:
 
     This class provides a static interface, so it doesn't need to be instantiated.
     This directly addresses the NFR-Security requirement from the PRD.
+
+    Lookups are cached in-process per account, since every sync cycle checks
+    the same tokens several times and each keyring call is a round-trip into
+    the OS credential store. The cache is kept in step by save/delete.
     """
+    _token_cache: dict[str, str | None] = {}
+    _cache_lock = threading.Lock()
 
     @staticmethod
     def save_token(account_name: str, token: str):
@@ -24,14 +34,20 @@ class AuthManager:
         """
         try:
             keyring.set_password(SERVICE_NAME, account_name, token)
-            logging.info(f"Successfully saved token for '{account_name}'.")
+            with AuthManager._cache_lock:
+                AuthManager._token_cache[account_name] = token
+            logger.info("Successfully saved token for '%s'.", account_name)
         except Exception as e:
-            logging.error(f"Failed to save token for '{account_name}': {e}")
+            # The store may be in an unknown state, so force the next read to hit it.
+            with AuthManager._cache_lock:
+                AuthManager._token_cache.pop(account_name, None)
+            logger.error("Failed to save token for '%s': %s", account_name, e)
 
     @staticmethod
     def get_token(account_name: str) -> str | None:
         """
-        Retrieves a token for a specific account.
+        Retrieves a token for a specific account, from the in-process cache
+        when it has already been looked up.
 
         Args:
             account_name (str): The name of the account/service (e.g., 'google').
@@ -39,15 +55,21 @@ class AuthManager:
         Returns:
             str | None: The retrieved token, or None if not found or an error occurs.
         """
+        with AuthManager._cache_lock:
+            if account_name in AuthManager._token_cache:
+                return AuthManager._token_cache[account_name]
+
         try:
             token = keyring.get_password(SERVICE_NAME, account_name)
+            with AuthManager._cache_lock:
+                AuthManager._token_cache[account_name] = token
             if token:
-                logging.info(f"Successfully retrieved token for '{account_name}'.")
+                logger.info("Successfully retrieved token for '%s'.", account_name)
             else:
-                logging.info(f"No token found for '{account_name}'.")
+                logger.info("No token found for '%s'.", account_name)
             return token
         except Exception as e:
-            logging.error(f"Failed to retrieve token for '{account_name}': {e}")
+            logger.error("Failed to retrieve token for '%s': %s", account_name, e)
             return None
 
     @staticmethod
@@ -59,11 +81,17 @@ class AuthManager:
             account_name (str): The name of the account/service (e.g., 'google').
         """
         try:
-            # Use get_password to check existence before trying to delete
-            if keyring.get_password(SERVICE_NAME, account_name) is not None:
-                keyring.delete_password(SERVICE_NAME, account_name)
-                logging.info(f"Successfully deleted token for '{account_name}'.")
-            else:
-                logging.warning(f"Attempted to delete non-existent token for '{account_name}'.")
+            # Delete directly; the backend reports a missing entry itself, so a
+            # get_password existence check would only add a second round-trip.
+            keyring.delete_password(SERVICE_NAME, account_name)
+            logger.info("Successfully deleted token for '%s'.", account_name)
+            with AuthManager._cache_lock:
+                AuthManager._token_cache[account_name] = None
+        except keyring.errors.PasswordDeleteError:
+            with AuthManager._cache_lock:
+                AuthManager._token_cache[account_name] = None
+            logger.warning("Attempted to delete non-existent token for '%s'.", account_name)
         except Exception as e:
-            logging.error(f"An error occurred while deleting token for '{account_name}': {e}")
\ No newline at end of file
+            with AuthManager._cache_lock:
+                AuthManager._token_cache.pop(account_name, None)
+            logger.error("An error occurred while deleting token for '%s': %s", account_name, e)
\ No newline at end of file
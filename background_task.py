@@ -0,0 +1,25 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+class BackgroundTask(QThread):
+    """
+    Runs a blocking callable, such as an OAuth login that waits on the browser,
+    on a worker thread so the Qt event loop (and with it the tray icon and
+    windows) keeps responding.
+
+    Connect to the inherited `finished` signal to act once the call returns;
+    `failed` is emitted with the exception if it raised. Both are delivered on
+    the GUI thread.
+    """
+    failed = pyqtSignal(Exception)
+
+    def __init__(self, func, *args, parent=None):
+        super().__init__(parent)
+        self._func = func
+        self._args = args
+
+    def run(self):
+        """Calls the wrapped function on the worker thread."""
+        try:
+            self._func(*self._args)
+        except Exception as e:
+            self.failed.emit(e)
@@ -1,13 +1,16 @@
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import List, Dict, Any
 
-from dateutil import parser
-
+from src.core.time_utils import parse_iso
 from src.services.google_cal import GoogleCalendarService
 from src.services.zoho_cal import ZohoCalendarService
 from src.services.auth_manager import AuthManager
 
+logger = logging.getLogger(__name__)
+
 class EventManager:
     """
     Manages fetching, merging, and sorting events from all connected calendar services.
@@ -17,6 +20,12 @@ class EventManager:
     def __init__(self):
         self.google_service = GoogleCalendarService()
         self.zoho_service = ZohoCalendarService()
+        # Every supported calendar as (service, credential store account, display name),
+        # built once so each sync just walks this tuple.
+        self.providers = (
+            (self.google_service, 'google', 'Google'),
+            (self.zoho_service, 'zoho', 'Zoho'),
+        )
 
     def get_unified_events(self, start_date: datetime.datetime, end_date: datetime.datetime) -> List[Dict[str, Any]]:
         """
@@ -32,33 +41,96 @@ class EventManager:
         """
         all_events = []
 
-        # Fetch from Google if a token exists in the keyring
-        if AuthManager.get_token('google'):
-            logging.info("Fetching events from Google Calendar.")
-            google_events = self.google_service.fetch_events(start_date, end_date)
-            all_events.extend(google_events)
-        else:
-            logging.info("Google account not connected. Skipping.")
-
-        # Fetch from Zoho if a token exists in the keyring
-        if AuthManager.get_token('zoho'):
-            logging.info("Fetching events from Zoho Calendar.")
-            zoho_events = self.zoho_service.fetch_events(start_date, end_date)
-            all_events.extend(zoho_events)
-        else:
-            logging.info("Zoho account not connected. Skipping.")
+        # Token lookups are served from AuthManager's in-process cache, so this is cheap
+        connected = []
+        for service, account_name, name in self.providers:
+            if AuthManager.get_token(account_name):
+                logger.info("Fetching events from %s Calendar.", name)
+                connected.append((service, name))
+            else:
+                logger.info("%s account not connected. Skipping.", name)
+
+        if len(connected) == 1:
+            # Nothing to overlap with, so skip spinning up a worker thread.
+            service, name = connected[0]
+            try:
+                all_events.extend(service.fetch_events(start_date, end_date))
+            except Exception as e:
+                logger.error("Failed to fetch events from %s Calendar: %s", name, e)
+        elif connected:
+            # The fetches are network-bound, so run them side by side: the sync then
+            # takes as long as the slowest provider rather than the sum of all of them.
+            with ThreadPoolExecutor(max_workers=len(connected)) as executor:
+                futures = {
+                    executor.submit(service.fetch_events, start_date, end_date): name
+                    for service, name in connected
+                }
+                for future in as_completed(futures):
+                    try:
+                        all_events.extend(future.result())
+                    except Exception as e:
+                        # One provider failing must not discard the other's events.
+                        logger.error("Failed to fetch events from %s Calendar: %s", futures[future], e)
 
         if not all_events:
             return []
 
+        # Parse and format each start time exactly once and keep the results on the event,
+        # so sorting and the UI/notification code downstream never redo that work.
+        for event in all_events:
+            try:
+                # Timed events carry assorted UTC offsets and all-day ones none at all;
+                # astimezone() brings both to aware local time, so any two compare and
+                # the displayed time is the user's own.
+                start_dt = parse_iso(event['start_time']).astimezone()
+                event['_start_dt'] = start_dt
+                event['_start_ts'] = start_dt.timestamp() # A plain float to sort on
+                event['_time_str'] = start_dt.strftime('%I:%M %p') # e.g., "02:30 PM"
+            except (ValueError, TypeError, KeyError) as e:
+                logger.error("Could not parse start time of event %s: %s", event.get('id'), e)
+                event['_start_dt'] = event['_start_ts'] = event['_time_str'] = None
+
+        all_events = self._dedupe_events(all_events)
+
         # Normalize and sort
         try:
-            # The key to robust sorting is parsing the datetime strings into actual datetime objects.
-            # dateutil.parser is excellent at handling various ISO 8601 formats from different APIs.
-            all_events.sort(key=lambda event: parser.isoparse(event['start_time']))
-            logging.info(f"Successfully merged and sorted {len(all_events)} events.")
-        except (parser.ParserError, TypeError) as e:
-            logging.error(f"Could not sort events due to a datetime parsing error: {e}")
+            # The key to robust sorting is comparing actual instants, not strings.
+            all_events.sort(key=itemgetter('_start_ts'))
+            logger.info("Successfully merged and sorted %s events.", len(all_events))
+        except (ValueError, TypeError) as e:
+            logger.error("Could not sort events due to a datetime parsing error: %s", e)
             # Return unsorted list in case of parsing failure to avoid crashing
 
-        return all_events
\ No newline at end of file
+        return all_events
+
+    @staticmethod
+    def _dedupe_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drops repeated events, keeping the first occurrence. The same meeting often
+        appears in both calendars (cross-invites) under different IDs, so events from
+        different sources are matched on start time (to the minute) plus the first 20
+        characters of the normalized title. Within one source only an exact ID repeat
+        is dropped, since two meetings there can share a minute and a title prefix.
+        Without this, each copy would be listed and get its own notification job.
+        """
+        seen_ids = set()
+        sources_by_key = {} # fuzzy key -> sources of the events kept under it
+        unique_events = []
+        for event in events:
+            source = event.get('source')
+            event_id = (source, event.get('id'))
+            if event_id in seen_ids:
+                continue
+
+            # Comparing parsed datetimes also matches '...Z' against '...+00:00'.
+            start = event.get('_start_dt')
+            start = start.replace(second=0, microsecond=0) if start is not None else event.get('start_time')
+            key = (start, (event.get('title') or '').strip().lower()[:20])
+            key_sources = sources_by_key.setdefault(key, set())
+            if key_sources - {source}:
+                continue # A copy of a meeting already kept from another calendar
+
+            seen_ids.add(event_id)
+            key_sources.add(source)
+            unique_events.append(event)
+        return unique_events
\ No newline at end of file
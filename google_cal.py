@@ -2,20 +2,49 @@ import datetime
 import os.path
 import logging
 import json
+import threading
 from typing import List, Dict, Any, Optional
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
+from src.core.time_utils import parse_iso
 from src.services.auth_manager import AuthManager
+from src.services._util import attendee_emails, orjson
+
+logger = logging.getLogger(__name__)
 
 # If modifying these scopes, delete the stored token.
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 ACCOUNT_NAME = 'google'
 CREDENTIALS_FILE = 'credentials.json' # Must be in the project root
+CALENDAR_IDS = ['primary'] # Calendars to read events from
+MAX_BATCH_SIZE = 50 # Google's limit on sub-requests per batch HTTP call
+PAGE_SIZE = 100 # Events per events.list page; longer listings are paged through
+HTTP_TIMEOUT = 10 # Seconds before an API request is abandoned
+AUTH_FLOW_TIMEOUT = 300 # Seconds to wait for the browser login before giving up
+
+class OrjsonModel(JsonModel):
+    """
+    A JsonModel that decodes API responses with orjson rather than the json module,
+    which matters for the full listings of busy calendars.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Leave anything unusual (e.g. an empty body) to the stock implementation
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
 
 class GoogleCalendarService:
     """
@@ -23,14 +52,35 @@ class GoogleCalendarService:
     This class implements FR-CAL-01 and parts of FR-CAL-04.
     """
 
-    def __init__(self):
+    def __init__(self, calendar_ids: Optional[List[str]] = None):
         self.creds: Optional[Credentials] = None
+        self.calendar_ids: List[str] = list(calendar_ids or CALENDAR_IDS)
+        self._service = None
+        self._service_creds: Optional[Credentials] = None
+        # The API resource wraps an httplib2 connection, which isn't thread-safe
+        self._service_lock = threading.Lock()
+        # Incremental sync state: the time window it covers, and per calendar the
+        # raw events currently in that window plus the token for the next delta.
+        self._sync_window: Optional[tuple] = None
+        self._window_bounds: Optional[tuple] = None # The window as aware datetimes
+        self._calendar_events: Dict[str, Dict[str, Dict]] = {}
+        self._sync_tokens: Dict[str, str] = {}
+        # Bumped by disconnect(), which mustn't wait for a fetch to finish; a fetch started
+        # under an older generation stores nothing. _state_lock is only held briefly, to
+        # make that check and the stores (or disconnect's reset) atomic.
+        self._generation = 0
+        self._state_lock = threading.Lock()
 
     def _get_credentials(self) -> Optional[Credentials]:
         """
         Gets valid user credentials. It tries to load them from the secure store,
         refreshes them if expired, or initiates a new login flow if necessary.
         """
+        # Reuse the credentials from the last call while they're valid and the
+        # account is still connected, instead of re-reading and re-parsing the token.
+        if self.creds and self.creds.valid and AuthManager.get_token(ACCOUNT_NAME):
+            return self.creds
+
         stored_token_str = AuthManager.get_token(ACCOUNT_NAME)
         creds = None
 
@@ -39,21 +89,21 @@ class GoogleCalendarService:
                 token_info = json.loads(stored_token_str)
                 creds = Credentials.from_authorized_user_info(token_info, SCOPES)
             except json.JSONDecodeError:
-                logging.error("Failed to decode stored Google token. Please re-authenticate.")
+                logger.error("Failed to decode stored Google token. Please re-authenticate.")
                 AuthManager.delete_token(ACCOUNT_NAME) # Clear corrupted token
 
         # If there are no (valid) credentials available, let the user log in.
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                logging.info("Refreshing Google API token.")
+                logger.info("Refreshing Google API token.")
                 try:
                     creds.refresh(Request())
                 except Exception as e:
-                    logging.error(f"Failed to refresh token: {e}. Please re-authenticate.")
+                    logger.error("Failed to refresh token: %s. Please re-authenticate.", e)
                     AuthManager.delete_token(ACCOUNT_NAME)
                     return self._initiate_auth_flow()
             else:
-                logging.info("No valid Google credentials found, initiating auth flow.")
+                logger.info("No valid Google credentials found, initiating auth flow.")
                 creds = self._initiate_auth_flow()
 
             # Save the credentials for the next run
@@ -66,69 +116,276 @@ class GoogleCalendarService:
     def _initiate_auth_flow(self) -> Optional[Credentials]:
         """Initiates the OAuth 2.0 installed application flow."""
         if not os.path.exists(CREDENTIALS_FILE):
-            logging.error(f"'{CREDENTIALS_FILE}' not found. Please download it from Google Cloud Console and place it in the project root.")
+            logger.error("'%s' not found. Please download it from Google Cloud Console and place it in the project root.", CREDENTIALS_FILE)
             return None
         try:
             flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
-            # The port=0 will find a free port, which is robust.
-            creds = flow.run_local_server(port=0)
+            # The port=0 will find a free port, which is robust. Without a timeout a login
+            # the user never finishes would hold the connection task forever.
+            creds = flow.run_local_server(port=0, timeout_seconds=AUTH_FLOW_TIMEOUT)
             return creds
         except Exception as e:
-            logging.error(f"Failed to run authentication flow: {e}")
+            logger.error("Failed to run authentication flow: %s", e)
             return None
 
     def fetch_events(self, start_date: datetime.datetime, end_date: datetime.datetime) -> List[Dict[str, Any]]:
         """
-        Fetches events from the user's primary calendar within a given date range.
+        Fetches events from the configured calendars within a given date range.
 
         Returns:
             A list of events, where each event is a standardized dictionary.
         """
         creds = self._get_credentials()
         if not creds:
-            logging.error("Cannot fetch Google Calendar events: Authentication failed.")
+            logger.error("Cannot fetch Google Calendar events: Authentication failed.")
             return []
 
         try:
-            service = build('calendar', 'v3', credentials=creds)
-
-            events_result = service.events().list(
-                calendarId='primary',
-                timeMin=start_date.isoformat(),
-                timeMax=end_date.isoformat(),
-                maxResults=50, # Reasonable limit for a day's/week's view
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
-            logging.info(f"Found {len(events)} events in Google Calendar.")
-            return [self._parse_event(e) for e in events]
-
+            with self._service_lock:
+                generation = self._generation
+                events = self._fetch_events(self._get_service(creds), start_date, end_date, generation)
+                if generation != self._generation:
+                    # Disconnected mid-fetch: drop the results and the connection they used
+                    self.close()
+                    return []
+                return events
         except HttpError as error:
-            logging.error(f'An HTTP error occurred: {error}')
+            logger.error('An HTTP error occurred: %s', error)
             return []
         except Exception as e:
-            logging.error(f'An unexpected error occurred while fetching events: {e}')
+            logger.error('An unexpected error occurred while fetching events: %s', e)
             return []
 
-    def _parse_event(self, event: Dict) -> Dict[str, Any]:
+    def _get_service(self, creds: Credentials):
+        """
+        Returns the Calendar API resource, building it only when the credentials change.
+        build() parses the whole discovery document, so it's far too slow to repeat on
+        every fetch; the bundled static document is used instead of a network fetch.
+        The resource owns a single authorized HTTP connection, kept alive between
+        fetches so each sync doesn't pay for a fresh TLS handshake.
+        """
+        if self._service is None or self._service_creds is not creds:
+            self.close()
+            authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._service = build('calendar', 'v3', http=authed_http,
+                                  model=OrjsonModel() if orjson else None,
+                                  cache_discovery=False, static_discovery=True)
+            self._service_creds = creds
+            # New credentials may belong to another account; don't apply deltas to old data
+            self._sync_window = None
+        return self._service
+
+    def _fetch_events(self, service, start_date: datetime.datetime, end_date: datetime.datetime,
+                      generation: int) -> List[Dict[str, Any]]:
+        """
+        Lists the events of every configured calendar through the given API resource.
+
+        The first fetch of a time window lists it in full and keeps the returned sync
+        token; later fetches of the same window only ask for what changed since then,
+        which for a quiet calendar is an empty response. Deltas are applied to the
+        events kept from the previous fetch.
+
+        Listings longer than PAGE_SIZE are followed page by page. Each round sends
+        the next page of every calendar that has one in a single batch call, and a
+        calendar's events are only replaced once its last page has arrived.
+        """
+        window = (start_date, end_date)
+        if window != self._sync_window:
+            # Sync tokens aren't bounded by time, so a new window starts from a full listing
+            self._sync_window = window
+            # astimezone() treats naive values as local time; the API needs an explicit offset
+            self._window_bounds = (start_date.astimezone(), end_date.astimezone())
+            self._calendar_events = {}
+            self._sync_tokens = {}
+
+        # The events each in-progress listing has gathered so far
+        listings = {calendar_id: self._start_listing(calendar_id) for calendar_id in self.calendar_ids}
+        pending = {calendar_id: self._list_request(service, calendar_id) for calendar_id in self.calendar_ids}
+        while pending:
+            follow_ups = {}
+            for calendar_id, result in self._execute_requests(service, pending).items():
+                if isinstance(result, HttpError):
+                    if result.resp.status == 410 and calendar_id in self._sync_tokens:
+                        # The sync token expired; fall back to a full listing
+                        logger.info("Sync token for calendar '%s' expired, doing a full sync.", calendar_id)
+                        self._sync_tokens.pop(calendar_id, None)
+                        listings[calendar_id] = self._start_listing(calendar_id)
+                        follow_ups[calendar_id] = self._list_request(service, calendar_id)
+                    else:
+                        # Keep the events from the last complete listing
+                        logger.error("An HTTP error occurred for calendar '%s': %s", calendar_id, result)
+                    continue
+                self._apply_sync_page(calendar_id, listings[calendar_id], result)
+                if result.get('nextPageToken'):
+                    follow_ups[calendar_id] = self._list_request(service, calendar_id, result['nextPageToken'])
+                else:
+                    self._finish_listing(calendar_id, listings[calendar_id], result, generation)
+            pending = follow_ups
+
+        events = [event for calendar_id in self.calendar_ids
+                  for event in self._calendar_events.get(calendar_id, {}).values()]
+        logger.info("Found %s events in Google Calendar.", len(events))
+        parse_event = self._parse_event
+        return [parse_event(e) for e in events]
+
+    def _list_request(self, service, calendar_id: str, page_token: Optional[str] = None):
+        """
+        Builds the events.list request for a calendar: a delta against the stored sync
+        token if there is one, otherwise a full listing of the current window. Pass
+        the previous response's nextPageToken to get the listing's next page.
+        """
+        if calendar_id in self._sync_tokens:
+            # timeMin/timeMax/orderBy can't be combined with a sync token
+            return service.events().list(
+                calendarId=calendar_id,
+                syncToken=self._sync_tokens[calendar_id],
+                pageToken=page_token,
+                maxResults=PAGE_SIZE,
+                singleEvents=True
+            )
+        start_date, end_date = self._window_bounds
+        return service.events().list(
+            calendarId=calendar_id,
+            timeMin=start_date.isoformat(),
+            timeMax=end_date.isoformat(),
+            pageToken=page_token,
+            maxResults=PAGE_SIZE,
+            singleEvents=True
+        )
+
+    def _start_listing(self, calendar_id: str) -> Dict[str, Dict]:
+        """
+        Returns the events a new listing of the calendar starts from: a copy of the
+        cached ones for a delta, nothing for a full listing.
+        """
+        if calendar_id in self._sync_tokens:
+            return dict(self._calendar_events.get(calendar_id, {}))
+        return {}
+
+    def _apply_sync_page(self, calendar_id: str, events: Dict[str, Dict], result: Dict[str, Any]):
+        """Merges one page of an events.list response (full listing or delta) into a listing's events."""
+        is_delta = calendar_id in self._sync_tokens
+        for item in result.get('items', []):
+            # A delta covers every date, so changes outside the window are dropped here
+            if item.get('status') == 'cancelled' or (is_delta and not self._in_window(item)):
+                events.pop(item['id'], None)
+            else:
+                events[item['id']] = item
+
+    def _finish_listing(self, calendar_id: str, events: Dict[str, Dict], result: Dict[str, Any],
+                        generation: int):
+        """
+        Stores a completed listing's events along with the sync token from its last
+        page, unless the account was disconnected since the fetch started.
+        """
+        with self._state_lock:
+            if generation != self._generation:
+                return
+            self._calendar_events[calendar_id] = events
+
+            # Only the last page of a listing carries a sync token; without one, the next
+            # fetch simply lists the window in full again.
+            if result.get('nextSyncToken'):
+                self._sync_tokens[calendar_id] = result['nextSyncToken']
+            else:
+                self._sync_tokens.pop(calendar_id, None)
+
+    def _in_window(self, event: Dict) -> bool:
+        """Returns whether a raw API event overlaps the current sync window."""
+        try:
+            start = parse_iso(event['start'].get('dateTime') or event['start'].get('date'))
+            end = parse_iso(event['end'].get('dateTime') or event['end'].get('date'))
+        except (KeyError, ValueError, TypeError):
+            return False
+        start_date, end_date = self._window_bounds
+        # astimezone() treats naive (all-day) values as local time, making all four comparable
+        return start.astimezone() < end_date and end.astimezone() > start_date
+
+    def _execute_requests(self, service, pending: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executes a set of API requests, bundling them into batch HTTP calls of up to
+        MAX_BATCH_SIZE sub-requests when there is more than one, so N calendars cost
+        one round-trip instead of N.
+
+        Args:
+            service: The calendar API resource the requests were built from.
+            pending: The requests to run, keyed by an ID unique within the batch.
+
+        Returns:
+            Each request's response body, or the HttpError it failed with, under its key.
+        """
+        if len(pending) == 1:
+            (request_id, request), = pending.items()
+            try:
+                return {request_id: request.execute()}
+            except HttpError as error:
+                return {request_id: error}
+
+        results = {}
+
+        def on_response(request_id, response, exception):
+            results[request_id] = exception if exception is not None else response
+
+        items = list(pending.items())
+        for i in range(0, len(items), MAX_BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=on_response)
+            for request_id, request in items[i:i + MAX_BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+        return results
+
+    @staticmethod
+    def _parse_event(event: Dict) -> Dict[str, Any]:
         """Converts a Google Calendar API event object into our standard format."""
-        start = event['start'].get('dateTime', event['start'].get('date'))
-        end = event['end'].get('dateTime', event['end'].get('date'))
+        # Timed events carry 'dateTime'; all-day events only have 'date'.
+        start_info, end_info = event['start'], event['end']
+        start = start_info.get('dateTime') or start_info.get('date')
+        end = end_info.get('dateTime') or end_info.get('date')
+        get = event.get
 
         return {
             'source': 'google',
             'id': event['id'],
-            'title': event.get('summary', 'No Title'),
+            'title': get('summary', 'No Title'),
             'start_time': start,
             'end_time': end,
-            'attendees': [att['email'] for att in event.get('attendees', []) if 'email' in att],
-            'location': event.get('location', None)
+            'attendees': attendee_emails(get('attendees', ())),
+            'location': get('location', None)
         }
 
-    @staticmethod
-    def disconnect():
-        """Deletes the stored token for Google Calendar."""
-        logging.info("Disconnecting Google Calendar account.")
-        AuthManager.delete_token(ACCOUNT_NAME)
\ No newline at end of file
+    def connect(self) -> bool:
+        """
+        Connects the account, running the browser login if there are no usable stored
+        credentials. Blocks until the user finishes, so call it off the GUI thread.
+
+        Returns:
+            bool: Whether the account is now connected.
+        """
+        return self._get_credentials() is not None
+
+    def close(self):
+        """Closes the API resource's HTTP connection, if one has been opened."""
+        if self._service is not None:
+            self._service.close()
+            self._service = self._service_creds = None
+
+    def disconnect(self):
+        """
+        Deletes the stored token for Google Calendar and drops the open connection.
+        It's called from the GUI thread, so it never waits for a fetch in progress;
+        that fetch discards its results and closes the connection itself.
+        """
+        logger.info("Disconnecting Google Calendar account.")
+        AuthManager.delete_token(ACCOUNT_NAME)
+        with self._state_lock:
+            self._generation += 1
+            # Forget the account's events and sync tokens rather than holding them until reconnect
+            self._sync_window = None
+            self._calendar_events = {}
+            self._sync_tokens = {}
+        self.creds = None
+        if self._service_lock.acquire(blocking=False):
+            try:
+                self.close()
+            finally:
+                self._service_lock.release()
\ No newline at end of file
@@ -1,26 +1,69 @@
 import sys
 import os
 import json
+import atexit
+import queue
+import threading
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
+from functools import cached_property
 
-from PyQt5.QtWidgets import QApplication
-from dateutil import parser
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication, QDialog, QSystemTrayIcon
+from PyQt5.QtCore import QObject, QSettings, QTimer, pyqtSignal
 
 from src.core.scheduler import Scheduler
-from src.core.tts_engine import TTSEngine
+from src.core.tts_engine import TTSEngine, get_tts_engine
 from src.core.event_manager import EventManager
 from src.ui.tray_icon import TrayIcon
 from src.ui.main_window import MainWindow
 from src.ui.settings_ui import SettingsWindow
 from src.ui.notification_popup import NotificationPopup
+from src.ui.background_task import BackgroundTask
 from src.services.auth_manager import AuthManager
 
 # --- Configuration ---
-SETTINGS_FILE = "settings.json"
+APP_NAME = "ChronoAI"
+LEGACY_SETTINGS_FILE = "settings.json" # Imported once into QSettings, then ignored
 ICON_PATH = "assets/icon.png"
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+DEFAULT_SETTINGS = {
+    "user_name": "User",
+    "reminder_time": 15, # minutes
+    "voice_id": None,
+    "snooze_duration": 5 # minutes
+}
+
+# The escalating audio sequence (FR-NOT-03) as (text template, volume, delay in seconds
+# after the previous step). Each delay allows ~1.5s of speech plus a 1.5s pause.
+NOTIFICATION_SEQUENCE = (
+    ("Psst, {name}...", 0.2, 0),
+    ("Hey {name}...", 0.4, 3.0),
+    ("{name}!", 0.75, 3.0),
+)
+TOTAL_SEQUENCE_DURATION = sum(delay for _, _, delay in NOTIFICATION_SEQUENCE) + 1.5 # Add buffer
+BACKGROUND_TASK_QUIT_WAIT_MS = 2000 # How long quitting waits for a connection flow to end
+
+# Packaged builds (PyInstaller sets sys.frozen) only log warnings and errors by default;
+# running from source keeps INFO for development.
+# Records are only queued on the thread that logs them (often the GUI thread); a
+# listener thread does the formatting and the console writes.
+_log_queue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.WARNING if getattr(sys, 'frozen', False) else logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop) # Flushes whatever is still queued
+
+class SyncSignals(QObject):
+    """
+    Carries the results of a calendar fetch, which runs on a scheduler worker thread,
+    back to the GUI thread; the connected slots run there as queued calls.
+    """
+    events_fetched = pyqtSignal(list)
 
 class ChronoAI:
     """
@@ -31,29 +74,40 @@ class ChronoAI:
         # This is crucial for tray apps; otherwise, the app quits when the last window is closed.
         self.app.setQuitOnLastWindowClosed(False)
 
-        # Initialize core components
-        self.tts_engine = TTSEngine()
+        # Initialize core components (the TTS engine and windows are created on first use)
         self.scheduler = Scheduler()
         self.event_manager = EventManager()
 
         # Load settings
+        self.settings_store = QSettings(APP_NAME, APP_NAME)
         self.settings = self.load_settings()
 
         # Initialize UI components
         if not os.path.exists(ICON_PATH):
-            logging.error(f"Icon file not found at {ICON_PATH}. Please create it.")
+            logging.error("Icon file not found at %s. Please create it.", ICON_PATH)
             # Ensure the directory exists before creating the file
             # Create a dummy file to prevent crashing
             os.makedirs(os.path.dirname(ICON_PATH), exist_ok=True)
             with open(ICON_PATH, 'w') as f: pass
 
-        self.main_window = MainWindow()
         self.tray_icon = TrayIcon(ICON_PATH)
-        self.settings_window = SettingsWindow(self.tts_engine.engine.getProperty('voices') if self.tts_engine.engine else [])
+
+        # The events from the last sync, kept so the dashboard can be filled when first opened
+        self.events = []
 
         # A reference to the current notification popup to prevent garbage collection
         self.notification_popup = None
 
+        # event_id -> (notification_time, title) of the notification jobs currently scheduled
+        self._scheduled_events = {}
+
+        # Running background tasks, referenced here so they aren't garbage collected mid-run
+        self._background_tasks = set()
+
+        self.sync_signals = SyncSignals()
+        # Held while a fetch runs; the manual and recurring sync jobs share it
+        self._fetch_lock = threading.Lock()
+
         # Connect signals and slots
         self.connect_signals()
 
@@ -65,122 +119,241 @@ class ChronoAI:
     def run(self):
         """Starts the application."""
         self.scheduler.start()
-        # Schedule the first sync to run immediately, then every 10 minutes
-        self.scheduler.add_job(self.sync_calendars, 'interval', minutes=10, id='recurring_sync')
+        # Schedule the first sync to run immediately, then every 10 minutes. The jitter
+        # spreads the periodic syncs of many installs away from the same instant.
+        self.scheduler.add_job(self.fetch_events, 'interval', minutes=10, jitter=60, id='recurring_sync')
         self.sync_calendars() # Run once on startup
+        # Create the TTS engine on the GUI thread once the event loop is up, rather than
+        # making startup wait for it or creating it later on a scheduler thread.
+        QTimer.singleShot(0, self._load_tts_engine)
 
         logging.info("ChronoAI is running. Starting Qt event loop.")
         sys.exit(self.app.exec_())
 
+    @cached_property
+    def tts_engine(self) -> TTSEngine:
+        """The TTS engine, initialized on first use since pyttsx3 start-up is slow on some platforms."""
+        tts_engine = get_tts_engine()
+        self.apply_voice(tts_engine)
+        return tts_engine
+
+    @cached_property
+    def main_window(self) -> MainWindow:
+        """The dashboard window, built the first time it's needed."""
+        main_window = MainWindow()
+        main_window.refresh_button.clicked.connect(self.sync_calendars)
+        main_window.settings_button.clicked.connect(self.open_settings)
+        main_window.update_events(self.events)
+        return main_window
+
+    @cached_property
+    def settings_window(self) -> SettingsWindow:
+        """The settings dialog, built on first open since enumerating the system voices is slow."""
+        voices = self.tts_engine.engine.getProperty('voices') if self.tts_engine.engine else []
+        settings_window = SettingsWindow(voices)
+        for service, account_name, _ in self.event_manager.providers:
+            button = getattr(settings_window, f"{account_name}_connect_button")
+            button.clicked.connect(lambda _checked=False, service=service, account_name=account_name:
+                                   self.toggle_connection(service, account_name))
+        return settings_window
+
+    def _is_created(self, name: str) -> bool:
+        """Returns whether a lazily created component has been built yet."""
+        return name in self.__dict__
+
+    def _load_tts_engine(self):
+        """Creates the lazy TTS engine if it doesn't exist yet."""
+        self.tts_engine
+
     def connect_signals(self):
         """Connects all UI signals to their corresponding slots."""
-        # Tray Icon actions
-        self.tray_icon.show_action.triggered.connect(self.main_window.show)
+        # Tray Icon actions (window signals are connected when each window is built)
+        self.tray_icon.show_action.triggered.connect(self.show_main_window)
         self.tray_icon.sync_action.triggered.connect(self.sync_calendars)
         self.tray_icon.quit_action.triggered.connect(self.app.quit)
         self.tray_icon.activated.connect(self.on_tray_icon_activated)
+        self.app.aboutToQuit.connect(self.cleanup)
+        self.sync_signals.events_fetched.connect(self.on_events_fetched)
 
-        # Main Window buttons
-        self.main_window.refresh_button.clicked.connect(self.sync_calendars)
-        self.main_window.settings_button.clicked.connect(self.open_settings)
-
-        # Settings Window account buttons
-        self.settings_window.google_connect_button.clicked.connect(self.toggle_google_connection)
-        self.settings_window.zoho_connect_button.clicked.connect(self.toggle_zoho_connection)
+    def cleanup(self):
+        """
+        Stops background work on quit without waiting for in-flight jobs to finish, and
+        gives any unfinished connection flow only a short grace period.
+        """
+        # Jobs are daemon threads and all state is rebuilt on the next start, so there's
+        # nothing a running sync or notification step needs to complete.
+        self.scheduler.shutdown(wait=False)
+        if self._is_created('tts_engine'):
+            self.tts_engine.shutdown()
+
+        # A connection flow may still be waiting on the user (a browser login or a console
+        # grant code). Qt aborts the process if a running QThread is destroyed, so one
+        # that doesn't end shortly is handed over to C++ ownership, which never deletes
+        # it, and is abandoned to the process exit.
+        for task in list(self._background_tasks):
+            if not task.wait(BACKGROUND_TASK_QUIT_WAIT_MS):
+                logging.warning("Abandoning an account connection flow that is still running.")
+                sip.transferto(task, None)
+        self._background_tasks.clear()
+
+    def show_main_window(self):
+        """Shows the dashboard window, building it on first use."""
+        self.main_window.show()
 
     def on_tray_icon_activated(self, reason):
-        """Shows the main window on a single click of the tray icon."""
-        if reason == QSystemTrayIcon.Trigger: # Single click
-            self.main_window.show()
+        """
+        Toggles the main window on a single click of the tray icon; a double click
+        always brings it up. Windows reports a double click as Trigger then DoubleClick,
+        so the second event must never hide the window the first one showed.
+        """
+        if reason == QSystemTrayIcon.Trigger and self._is_created('main_window') and self.main_window.isVisible():
+            self.main_window.hide()
+        elif reason in (QSystemTrayIcon.Trigger, QSystemTrayIcon.DoubleClick):
+            self.show_main_window()
+            self.main_window.raise_()
+            self.main_window.activateWindow()
 
     def load_settings(self) -> dict:
-        """Loads settings from the JSON file or creates default settings."""
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r') as f:
-                logging.info("Loading settings from file.")
-                return json.load(f)
-        else:
-            logging.info("No settings file found, creating default settings.")
-            return {
-                "user_name": "User",
-                "reminder_time": 15, # minutes
-                "voice_id": None,
-                "snooze_duration": 5 # minutes
-            }
+        """
+        Loads settings from the OS-native store (registry, plist or INI via QSettings),
+        filling in defaults for anything not saved yet.
+        """
+        if not self.settings_store.allKeys() and os.path.exists(LEGACY_SETTINGS_FILE):
+            logging.info("Importing settings from legacy settings file.")
+            with open(LEGACY_SETTINGS_FILE, 'r') as f:
+                for key, value in json.load(f).items():
+                    self.settings_store.setValue(key, value)
+
+        settings = {}
+        for key, default in DEFAULT_SETTINGS.items():
+            if default is None:
+                settings[key] = self.settings_store.value(key, default)
+            else:
+                # Backends such as INI files hand values back as strings without a type hint
+                settings[key] = self.settings_store.value(key, default, type=type(default))
+        logging.info("Settings loaded.")
+        return settings
 
     def save_settings(self):
-        """Saves the current settings to the JSON file."""
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(self.settings, f, indent=4)
+        """Saves the current settings, writing only the keys to the native store."""
+        for key, value in self.settings.items():
+            self.settings_store.setValue(key, value)
+        self.settings_store.sync()
         logging.info("Settings saved.")
 
     def apply_settings(self):
-        """Applies the loaded settings to the application components."""
-        if self.settings.get("voice_id") and self.tts_engine.engine:
-            self.tts_engine.engine.setProperty('voice', self.settings["voice_id"])
-        self.update_account_status_in_settings()
+        """Applies the loaded settings to the components that have been created so far."""
+        # The whispered phrases only depend on the user's name, so format them here once
+        user_name = self.settings.get("user_name", "User")
+        self.whisper_texts = tuple(text.format(name=user_name) for text, _, _ in NOTIFICATION_SEQUENCE)
+        if self._is_created('tts_engine'):
+            self.apply_voice(self.tts_engine)
+        if self._is_created('settings_window'):
+            self.update_account_status_in_settings()
         logging.info("Settings applied.")
 
+    def apply_voice(self, tts_engine: TTSEngine):
+        """Sets the configured voice on the given TTS engine."""
+        if self.settings.get("voice_id") and tts_engine.engine:
+            tts_engine.engine.setProperty('voice', self.settings["voice_id"])
+
     def sync_calendars(self):
-        """Fetches events, updates the UI, and schedules notifications."""
-        logging.info("Starting calendar sync...")
+        """
+        Starts a calendar sync on a scheduler worker thread, so the network calls never
+        block the GUI; the results are applied by on_events_fetched once they arrive.
+        """
         self.tray_icon.show_message("ChronoAI", "Syncing calendars...")
+        # Runs immediately; fetch_events skips it if a sync is already in progress
+        self.scheduler.add_job(self.fetch_events, id='calendar_fetch', replace_existing=True)
 
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
-
-        events = self.event_manager.get_unified_events(today_start, today_end)
-        self.main_window.update_events(events)
+    def fetch_events(self):
+        """
+        Fetches today's events from all connected calendars. Runs off the GUI thread.
+        Both the manual ('calendar_fetch') and the recurring ('recurring_sync') jobs
+        run this; if one is already fetching, the other returns at once, so two sets
+        of results can never arrive out of order.
+        """
+        if not self._fetch_lock.acquire(blocking=False):
+            logging.info("A calendar sync is already in progress; skipping this one.")
+            return
+        try:
+            logging.info("Starting calendar sync...")
+
+            today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            today_end = today_start + timedelta(days=1)
+
+            events = self.event_manager.get_unified_events(today_start, today_end)
+            self.sync_signals.events_fetched.emit(events)
+        finally:
+            self._fetch_lock.release()
+
+    def on_events_fetched(self, events: list):
+        """Updates the UI and schedules notifications for freshly fetched events."""
+        self.events = events
+        if self._is_created('main_window'):
+            self.main_window.update_events(events)
         self.schedule_notifications(events)
         logging.info("Calendar sync complete.")
 
     def schedule_notifications(self, events: list):
-        """Schedules a notification job for each upcoming event."""
-        # First, clear any existing notification jobs to prevent duplicates
-        for job in self.scheduler.get_jobs():
-            if job.id.startswith('event_notification_'):
-                self.scheduler.remove_job(job.id)
+        """
+        Schedules a notification job for each upcoming event.
 
-        now = datetime.now()
-        reminder_minutes = self.settings.get("reminder_time", 15)
+        Only the difference from the previous call is applied to the scheduler: jobs
+        are removed for events that disappeared or changed (time or title), and added
+        for new or changed ones. An unchanged calendar, the common case for the
+        recurring sync, therefore doesn't touch the scheduler at all.
+        """
+        now = datetime.now().astimezone() # Event start times are aware local datetimes
+        reminder_delta = timedelta(minutes=self.settings.get("reminder_time", 15))
 
+        # event_id -> ((notification_time, title), event) for every notification we want
+        desired = {}
         for event in events:
             try:
-                start_time = parser.isoparse(event['start_time'])
-                notification_time = start_time - timedelta(minutes=reminder_minutes)
+                start_time = event['_start_dt']
+                notification_time = start_time - reminder_delta
 
                 # Only schedule notifications for future events
                 if notification_time > now:
-                    job_id = f"event_notification_{event['id']}"
-                    self.scheduler.add_job(
-                        self.trigger_notification_flow,
-                        args=[event],
-                        trigger='date',
-                        run_date=notification_time,
-                        id=job_id,
-                        replace_existing=True # Belt-and-suspenders
-                    )
-            except (parser.ParserError, TypeError) as e:
-                logging.error(f"Could not schedule notification for event {event.get('id')}: {e}")
+                    desired[event['id']] = ((notification_time, event.get('title')), event)
+            except (ValueError, TypeError) as e:
+                logging.error("Could not schedule notification for event %s: %s", event.get('id'), e)
+
+        with self.scheduler.batch():
+            # Drop notifications that are no longer wanted or whose event changed, all
+            # in one pass; jobs whose time has passed already ran and are skipped.
+            stale_ids = [event_id for event_id, signature in self._scheduled_events.items()
+                         if event_id not in desired or desired[event_id][0] != signature]
+            for event_id in stale_ids:
+                del self._scheduled_events[event_id]
+            self.scheduler.remove_jobs(f"event_notification_{event_id}" for event_id in stale_ids)
+
+            for event_id, (signature, event) in desired.items():
+                if event_id in self._scheduled_events:
+                    continue
+                self.scheduler.add_job(
+                    self.trigger_notification_flow,
+                    args=[event],
+                    trigger='date',
+                    run_date=signature[0],
+                    id=f"event_notification_{event_id}",
+                    replace_existing=True # A snoozed reminder may still hold this ID
+                )
+                self._scheduled_events[event_id] = signature
 
     def trigger_notification_flow(self, event: dict):
         """
         Triggers the full interactive notification flow, including the pop-up
         and escalating audio, fulfilling FR-NOT-02 to FR-NOT-07.
         """
-        logging.info(f"--- NOTIFICATION TRIGGERED FOR: {event['title']} ---")
-        user_name = self.settings.get("user_name", "User")
+        logging.info("--- NOTIFICATION TRIGGERED FOR: %s ---", event['title'])
 
         # 1. Create and show the popup
         self.notification_popup = NotificationPopup(event['title'])
 
-        # Define the escalating audio sequence (FR-NOT-03)
-        sequence = [
-            {"text": f"Psst, {user_name}...", "volume": 0.2, "delay": 0},
-            {"text": f"Hey {user_name}...", "volume": 0.4, "delay": 3.0}, # 1.5s speech + 1.5s pause
-            {"text": f"{user_name}!", "volume": 0.75, "delay": 3.0}, # 1.5s speech + 1.5s pause
-        ]
-        total_sequence_duration = sum(step['delay'] for step in sequence) + 1.5 # Add buffer
+        # The full details spoken once the sequence ends, whichever handler ends it
+        details_text = f"You have a meeting at {event['_time_str']} titled {event['title']}. Just wanted to let you know."
 
         # --- Define handler functions ---
         def on_acknowledged():
@@ -188,14 +361,9 @@ class ChronoAI:
             self.tts_engine.stop()
 
             # Clean up all scheduled parts of this notification sequence
-            for i in range(len(sequence)):
-                self.scheduler.remove_job(f"notification_step_{event['id']}_{i}")
-            self.scheduler.remove_job(f"notification_timeout_{event['id']}")
+            self.remove_notification_sequence_jobs(event['id'])
 
             # Speak the full details (FR-NOT-06)
-            start_time = parser.isoparse(event['start_time'])
-            time_str = start_time.strftime('%I:%M %p')
-            details_text = f"You have a meeting at {time_str} titled {event['title']}. Just wanted to let you know."
             self.tts_engine.speak(details_text, volume=0.8)
 
         def on_timeout():
@@ -205,20 +373,15 @@ class ChronoAI:
                 self.notification_popup.close()
 
             # Speak the full details (FR-NOT-07)
-            start_time = parser.isoparse(event['start_time'])
-            time_str = start_time.strftime('%I:%M %p')
-            details_text = f"You have a meeting at {time_str} titled {event['title']}. Just wanted to let you know."
             self.tts_engine.speak(details_text, volume=0.8)
 
         def on_snoozed():
             snooze_minutes = self.settings.get("snooze_duration", 5)
-            logging.info(f"Notification snoozed by user for {snooze_minutes} minutes.")
+            logging.info("Notification snoozed by user for %s minutes.", snooze_minutes)
             self.tts_engine.stop()
 
             # Clean up all scheduled parts of this notification sequence
-            for i in range(len(sequence)):
-                self.scheduler.remove_job(f"notification_step_{event['id']}_{i}")
-            self.scheduler.remove_job(f"notification_timeout_{event['id']}")
+            self.remove_notification_sequence_jobs(event['id'])
 
             # Reschedule the notification for later
             snooze_time = datetime.now() + timedelta(minutes=snooze_minutes)
@@ -237,69 +400,97 @@ class ChronoAI:
         self.notification_popup.snoozed.connect(on_snoozed)
         self.notification_popup.show()
 
-        # 3. Schedule the escalating audio sequence
-        base_time = datetime.now()
-        current_delay = 0
-        for i, step in enumerate(sequence):
-            run_time = base_time + timedelta(seconds=current_delay)
-            self.scheduler.add_job(
-                self.tts_engine.speak,
-                args=[step["text"], step["volume"]],
-                id=f"notification_step_{event['id']}_{i}",
-                trigger='date',
-                run_date=run_time
-            )
-            current_delay += step["delay"]
-
-        # 4. Schedule the timeout handler
-        timeout_time = base_time + timedelta(seconds=total_sequence_duration)
-        self.scheduler.add_job(on_timeout, id=f"notification_timeout_{event['id']}", trigger='date', run_date=timeout_time)
+        with self.scheduler.batch():
+            # 3. Schedule the escalating audio sequence
+            base_time = datetime.now()
+            current_delay = 0
+            for i, ((_, volume, delay), text) in enumerate(zip(NOTIFICATION_SEQUENCE, self.whisper_texts)):
+                current_delay += delay
+                run_time = base_time + timedelta(seconds=current_delay)
+                self.scheduler.add_job(
+                    self.tts_engine.speak,
+                    args=[text, volume],
+                    id=f"notification_step_{event['id']}_{i}",
+                    trigger='date',
+                    run_date=run_time
+                )
+
+            # 4. Schedule the timeout handler
+            timeout_time = base_time + timedelta(seconds=TOTAL_SEQUENCE_DURATION)
+            self.scheduler.add_job(on_timeout, id=f"notification_timeout_{event['id']}", trigger='date', run_date=timeout_time)
+
+    def remove_notification_sequence_jobs(self, event_id: str):
+        """Removes the pending audio steps and timeout of an event's notification sequence."""
+        job_ids = [f"notification_step_{event_id}_{i}" for i in range(len(NOTIFICATION_SEQUENCE))]
+        job_ids.append(f"notification_timeout_{event_id}")
+        self.scheduler.remove_jobs(job_ids)
 
     def open_settings(self):
         """Opens the settings dialog and handles the result."""
         self.settings_window.load_settings(self.settings)
         self.update_account_status_in_settings()
+        accounts_before = self.connected_accounts()
 
         if self.settings_window.exec_() == QDialog.Accepted:
             self.settings = self.settings_window.get_settings()
             self.save_settings()
             self.apply_settings()
-            # Reschedule notifications with new settings
-            self.sync_calendars()
+            if self.connected_accounts() != accounts_before:
+                # An account was connected or disconnected, so the events themselves changed
+                self.sync_calendars()
+            else:
+                # Reschedule notifications with new settings; the events are unchanged
+                self.schedule_notifications(self.events)
             logging.info("Settings updated and applied.")
 
+    def connected_accounts(self) -> set:
+        """Returns the names of the calendar accounts that are currently connected."""
+        return {account_name for _, account_name, _ in self.event_manager.providers
+                if AuthManager.get_token(account_name)}
+
     def update_account_status_in_settings(self):
         """Updates the connection status labels in the settings window."""
-        # Google
-        if AuthManager.get_token('google'):
-            self.settings_window.google_status_label.setText("Connected")
-            self.settings_window.google_connect_button.setText("Disconnect")
-        else:
-            self.settings_window.google_status_label.setText("Not Connected")
-            self.settings_window.google_connect_button.setText("Connect")
-        # Zoho
-        if AuthManager.get_token('zoho'):
-            self.settings_window.zoho_status_label.setText("Connected")
-            self.settings_window.zoho_connect_button.setText("Disconnect")
+        connected = self.connected_accounts()
+        for _, account_name, _ in self.event_manager.providers:
+            is_connected = account_name in connected
+            getattr(self.settings_window, f"{account_name}_status_label").setText(
+                "Connected" if is_connected else "Not Connected")
+            getattr(self.settings_window, f"{account_name}_connect_button").setText(
+                "Disconnect" if is_connected else "Connect")
+
+    def toggle_connection(self, service, account_name: str):
+        """Disconnects the account if it's connected, otherwise starts its connection flow."""
+        if AuthManager.get_token(account_name):
+            service.disconnect()
+            self.update_account_status_in_settings()
         else:
-            self.settings_window.zoho_status_label.setText("Not Connected")
-            self.settings_window.zoho_connect_button.setText("Connect")
+            # Google waits on a browser login and Zoho on a console grant code, so run
+            # the flow off the GUI thread
+            self.run_connection_flow(service.connect,
+                                     getattr(self.settings_window, f"{account_name}_connect_button"))
 
-    def toggle_google_connection(self):
-        if AuthManager.get_token('google'):
-            self.event_manager.google_service.disconnect()
-        else:
-            # This will block and open a browser
-            self.event_manager.google_service._get_credentials()
-        self.update_account_status_in_settings()
+    def run_connection_flow(self, connect, button):
+        """
+        Runs a blocking account-connection flow on a BackgroundTask, keeping the UI
+        responsive meanwhile, and refreshes the account status when it ends.
 
-    def toggle_zoho_connection(self):
-        if AuthManager.get_token('zoho'):
-            self.event_manager.zoho_service.disconnect()
-        else:
-            # This will block and print to console
-            self.event_manager.zoho_service._get_access_token()
-        self.update_account_status_in_settings()
+        Args:
+            connect (callable): The flow to run, e.g. a calendar service's connect method.
+            button (QPushButton): The connect button, disabled while the flow runs.
+        """
+        button.setEnabled(False)
+        button.setText("Connecting...")
+        task = BackgroundTask(connect)
+
+        def on_finished():
+            self._background_tasks.discard(task)
+            button.setEnabled(True)
+            self.update_account_status_in_settings()
+
+        task.failed.connect(lambda e: logging.error("Account connection failed: %s", e))
+        task.finished.connect(on_finished)
+        self._background_tasks.add(task)
+        task.start()
 
 if __name__ == '__main__':
     app = ChronoAI()
@@ -1,11 +1,12 @@
+import logging
 from typing import List, Dict, Any
 
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel,
-                             QListWidget, QPushButton, QListWidgetItem,
-                             QHBoxLayout)
+                             QListWidget, QPushButton, QHBoxLayout)
 from PyQt5.QtCore import Qt, QEvent
 from PyQt5.QtGui import QFont
-from dateutil import parser
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
     """
@@ -47,31 +48,49 @@ class MainWindow(QMainWindow):
         # The signals for these buttons (e.g., self.refresh_button.clicked)
         # will be connected in the main application logic.
 
+        # The rows currently shown, so an unchanged sync doesn't rebuild the list
+        self._display_texts: List[str] = []
+
     def update_events(self, events: List[Dict[str, Any]]):
         """
         Clears the current list and populates it with a new set of events.
+        Rows are built up front and added in a single call with repaints
+        suspended, so the list is redrawn once instead of once per event. If the
+        rows match what is already shown, the list is left untouched.
         """
-        self.event_list_widget.clear()
         if not events:
-            self.event_list_widget.addItem("No upcoming events for today.")
-            return
+            display_texts = ["No upcoming events for today."]
+        else:
+            display_texts = []
+            for event in events:
+                try:
+                    # EventManager already parsed and formatted the start time
+                    time_str = event['_time_str']
+                    if time_str is None:
+                        raise ValueError("start time could not be parsed")
 
-        for event in events:
-            try:
-                # Parse the datetime string and format it nicely
-                start_time = parser.isoparse(event['start_time'])
-                time_str = start_time.strftime('%I:%M %p')  # e.g., "02:30 PM"
+                    title = event.get('title', 'No Title')
+                    source = event.get('source', 'Unknown').capitalize()
 
-                title = event.get('title', 'No Title')
-                source = event.get('source', 'Unknown').capitalize()
+                    display_texts.append(f"{time_str} - {title} ({source})")
 
-                display_text = f"{time_str} - {title} ({source})"
-                item = QListWidgetItem(display_text)
-                self.event_list_widget.addItem(item)
+                except (KeyError, ValueError) as e:
+                    # Arguments are only formatted if the record is actually emitted
+                    logger.warning("Could not parse event: %s. Error: %s", event, e)
+
+        if display_texts == self._display_texts:
+            return
+        self._display_texts = display_texts
 
-            except (parser.ParserError, TypeError) as e:
-                # Log this error in a real scenario
-                print(f"Could not parse event: {event}. Error: {e}")
+        list_widget = self.event_list_widget
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            list_widget.addItems(display_texts)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
 
     def closeEvent(self, event: QEvent):
         """
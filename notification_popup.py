@@ -46,6 +46,8 @@ class NotificationPopup(QWidget):
         self.setLayout(layout)
 
         # --- Positioning ---
+        # Worked out for every popup, since monitors, resolution or the taskbar may
+        # have changed since the last one
         screen_geometry = QDesktopWidget().availableGeometry()
         self.move(screen_geometry.right() - self.width() - 15,
                   screen_geometry.bottom() - self.height() - 15)
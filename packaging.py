@@ -1,5 +1,6 @@
 import PyInstaller.__main__
 import os
+import pkgutil
 import platform
 import shutil
 
@@ -9,6 +10,15 @@ SCRIPT_NAME = "main.py"
 SRC_DIR = "src"
 ICON_NAME = "icon.png"
 ASSETS_DIR = "assets"
+UPX_DIR_ENV = "CHRONOAI_UPX_DIR" # Set to a UPX install dir to compress the bundle
+
+# Credential store and TTS backends are loaded as plugins, so PyInstaller can't see
+# them. Only the current platform's are bundled, since each build targets one OS.
+PLATFORM_HIDDEN_IMPORTS = {
+    'Windows': ['keyring.backends.Windows.WinVaultKeyring', 'pyttsx3.drivers.sapi5'],
+    'Darwin': ['keyring.backends.macOS.Keyring', 'pyttsx3.drivers.nsss'],
+    'Linux': ['keyring.backends.SecretService.Keyring', 'pyttsx3.drivers.espeak'],
+}
 
 def main():
     """Runs the PyInstaller packaging process."""
@@ -17,13 +27,19 @@ def main():
     icon_path = os.path.join(ASSETS_DIR, ICON_NAME)
 
     # --- PyInstaller Command Arguments ---
+    # A one-folder build starts much faster than --onefile, which unpacks the
+    # whole archive to a temp dir on every launch.
     command = [
         '--name', APP_NAME,
-        '--onefile',
+        '--onedir',
         '--windowed',  # Use '--noconsole' on Windows, this is an alias
         f'--icon={icon_path}',
     ]
 
+    upx_dir = os.environ.get(UPX_DIR_ENV)
+    if upx_dir:
+        command.append(f'--upx-dir={upx_dir}')
+
     # --- Add Data (Assets) ---
     # The separator for --add-data is platform-dependent (';' on Windows, ':' on others)
     data_separator = ';' if platform.system() == 'Windows' else ':'
@@ -35,13 +51,13 @@ def main():
     # PyInstaller sometimes misses these, especially for libraries with plugins.
     hidden_imports = [
         'pkg_resources.py2_warn',
-        'keyring.backends.Windows.WinVaultKeyring',  # For Windows
-        'keyring.backends.macOS.Keyring',            # For macOS
-        'keyring.backends.SecretService.Keyring',    # For Linux
-        'pyttsx3.drivers.sapi5',                     # For Windows TTS
-        'pyttsx3.drivers.nsss',                      # For macOS TTS
-        'pyttsx3.drivers.espeak',                    # For Linux TTS
+        'orjson',  # Optional fast JSON decoding
     ]
+    hidden_imports.extend(PLATFORM_HIDDEN_IMPORTS.get(platform.system(), []))
+    # Every module of the app itself, so one only reached dynamically can't go missing
+    hidden_imports.extend(
+        module.name for module in pkgutil.walk_packages([SRC_DIR], prefix=f'{SRC_DIR}.')
+    )
 
     for hidden_import in hidden_imports:
         command.extend(['--hidden-import', hidden_import])
@@ -53,7 +69,7 @@ def main():
     print(f"Running PyInstaller with command:\n{' '.join(command)}\n")
     PyInstaller.__main__.run(command)
 
-    print("\nPackaging complete. Check the 'dist' folder for the executable.")
+    print(f"\nPackaging complete. Check the 'dist/{APP_NAME}' folder for the executable.")
     print("Cleaning up build files...")
     shutil.rmtree('build', ignore_errors=True)
     os.remove(f'{APP_NAME}.spec')
@@ -1,44 +1,40 @@
-import time
+import signal
+import threading
 import logging
 from datetime import datetime, timedelta
 
 from src.core.scheduler import Scheduler
-from src.core.tts_engine import TTSEngine
+from src.core.tts_engine import get_tts_engine
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def run_escalating_notification(user_name: str):
+def run_escalating_notification(user_name: str, cancel: threading.Event):
     """
     Executes the escalating audio notification sequence as defined in the PRD (FR-NOT-03).
-    This function is designed to be called by the scheduler.
+    This function is designed to be called by the scheduler, and plays the whole
+    sequence itself on the scheduler's worker thread instead of scheduling a job per step.
+
+    Args:
+        user_name (str): The name to address the user by.
+        cancel (threading.Event): Ends the sequence as soon as it's set, even mid-pause.
     """
-    tts = TTSEngine()
-    scheduler = Scheduler()
+    tts = get_tts_engine()
 
-    # Define the sequence steps
+    # Define the sequence steps; each delay is the pause before that step starts
     sequence = [
         {"text": f"Psst, {user_name}...", "volume": 0.2, "delay": 0},
         {"text": f"Hey {user_name}...", "volume": 0.4, "delay": 3.0}, # 1.5s for speech + 1.5s pause
         {"text": f"{user_name}!", "volume": 0.75, "delay": 3.0}, # 1.5s for speech + 1.5s pause
     ]
 
-    base_time = datetime.now()
-    current_delay = 0
-
     logging.info("--- Starting Escalating Notification Sequence ---")
 
-    for i, step in enumerate(sequence):
-        # We schedule each part of the sequence to run at a specific time.
-        # This is more robust than using time.sleep() in a long-running function.
-        run_time = base_time + timedelta(seconds=current_delay)
-        scheduler.add_job(
-            tts.speak,
-            args=[step["text"], step["volume"]],
-            id=f"notification_step_{i}",
-            trigger='date',
-            run_date=run_time
-        )
-        current_delay += step["delay"]
+    for step in sequence:
+        if cancel.wait(step["delay"]):
+            logging.info("Notification sequence cancelled.")
+            tts.stop()
+            return
+        tts.speak(step["text"], step["volume"])
 
 def main():
     """
@@ -51,20 +47,23 @@ def main():
 
     scheduler = Scheduler()
     scheduler.start()
+    # Set on Ctrl+C; it both wakes the main thread and cancels a sequence in progress
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
 
     notification_time = datetime.now() + timedelta(seconds=SECONDS_TO_WAIT_BEFORE_START)
-    logging.info(f"Scheduling notification sequence to start at {notification_time.strftime('%H:%M:%S')}")
+    logging.info("Scheduling notification sequence to start at %s", notification_time.strftime('%H:%M:%S'))
 
-    scheduler.add_job(run_escalating_notification, args=[USER_NAME], trigger='date', run_date=notification_time)
+    scheduler.add_job(run_escalating_notification, args=[USER_NAME, stop], trigger='date', run_date=notification_time)
 
-    logging.info(f"Proof-of-concept script running. Waiting for scheduled job. Press Ctrl+C to exit.")
-    try:
-        # Keep the script alive to allow the background scheduler to run its jobs.
-        while True:
-            time.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
-        logging.info("Script interrupted. Shutting down.")
-        scheduler.shutdown()
+    logging.info("Proof-of-concept script running. Waiting for scheduled job. Press Ctrl+C to exit.")
+    # Keep the script alive to allow the background scheduler to run its jobs. The main
+    # thread sleeps until Ctrl+C sets the event. The wait is timed because an untimed
+    # Event.wait() can't be interrupted on Windows, so the signal handler would never run.
+    while not stop.wait(0.5):
+        pass
+    logging.info("Script interrupted. Shutting down.")
+    scheduler.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
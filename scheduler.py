@@ -1,9 +1,13 @@
 import logging
+from contextlib import contextmanager
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.jobstores.base import JobLookupError
 import atexit
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class Scheduler:
     """
@@ -17,24 +21,61 @@ class Scheduler:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Scheduler, cls).__new__(cls)
+            # Jobs are transient (they're rebuilt from the calendars on every sync), so an
+            # in-memory store avoids any serialization or disk I/O per add/remove.
             # daemon=True ensures the scheduler thread exits when the main app exits
-            cls._scheduler = BackgroundScheduler(daemon=True)
-            logging.info("Scheduler initialized.")
+            cls._scheduler = BackgroundScheduler(
+                jobstores={'default': MemoryJobStore()},
+                executors={'default': ThreadPoolExecutor(4)},
+                job_defaults={
+                    'coalesce': True,          # Run a backlog of missed sync runs only once
+                    'max_instances': 1,        # Never overlap two runs of the same job
+                    'misfire_grace_time': 60,  # Still fire jobs up to a minute late
+                },
+                daemon=True
+            )
+            logger.info("Scheduler initialized.")
         return cls._instance
 
     def start(self):
         """Starts the background scheduler if it's not already running."""
         if not self._scheduler.running:
             self._scheduler.start()
+            # Run a no-op right away so the executor spawns its first worker thread now,
+            # rather than delaying the first real job (e.g. a notification step).
+            self._scheduler.add_job(lambda: None, id='executor_warmup')
             # Ensure the scheduler shuts down cleanly when the application exits
             atexit.register(self.shutdown)
-            logging.info("Scheduler started.")
+            logger.info("Scheduler started.")
 
-    def shutdown(self):
-        """Shuts down the scheduler and waits for running jobs to complete."""
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the scheduler.
+
+        Args:
+            wait (bool): Whether to block until running jobs have completed.
+        """
         if self._scheduler.running:
-            logging.info("Shutting down scheduler.")
-            self._scheduler.shutdown()
+            logger.info("Shutting down scheduler.")
+            self._scheduler.shutdown(wait=wait)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several job additions/removals into one scheduler wakeup.
+
+        Each add_job on a running scheduler wakes its thread to recompute the next
+        run time. While paused that is skipped, and resuming wakes it once at the end.
+        Nested or concurrent use is safe: only the outermost caller pauses/resumes.
+        """
+        paused_here = self._scheduler.state == STATE_RUNNING
+        if paused_here:
+            self._scheduler.pause()
+        try:
+            yield
+        finally:
+            if paused_here:
+                self._scheduler.resume()
 
     def add_job(self, func, *args, **kwargs):
         """
@@ -49,7 +90,7 @@ class Scheduler:
             str: The ID of the added job.
         """
         job = self._scheduler.add_job(func, *args, **kwargs)
-        logging.info(f"Added job '{job.id}' with trigger: {job.trigger}")
+        logger.info("Added job '%s' with trigger: %s", job.id, job.trigger)
         return job.id
 
     def remove_job(self, job_id: str):
@@ -61,9 +102,30 @@ class Scheduler:
         """
         try:
             self._scheduler.remove_job(job_id)
-            logging.info(f"Successfully removed job '{job_id}'.")
+            logger.info("Successfully removed job '%s'.", job_id)
         except JobLookupError:
-            logging.warning(f"Could not remove job '{job_id}': Job not found.")
+            logger.warning("Could not remove job '%s': Job not found.", job_id)
+
+    def remove_jobs(self, job_ids):
+        """
+        Removes a group of jobs, silently skipping any that no longer exist (such as
+        date jobs that have already run). The jobstore lock is taken once for the
+        whole group rather than once per job.
+
+        Args:
+            job_ids (iterable of str): The IDs of the jobs to remove.
+        """
+        removed = []
+        # The scheduler's lock is re-entrant, so remove_job can take it again inside
+        with self._scheduler._jobstores_lock:
+            for job_id in job_ids:
+                try:
+                    self._scheduler.remove_job(job_id)
+                    removed.append(job_id)
+                except JobLookupError:
+                    pass
+        if removed:
+            logger.info("Successfully removed jobs: %s.", ', '.join(removed))
 
     def get_jobs(self):
         """Returns a list of all scheduled jobs."""
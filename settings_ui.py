@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit,
                              QComboBox, QPushButton, QDialogButtonBox,
-                             QLabel, QHBoxLayout, QGroupBox)
+                             QLabel, QHBoxLayout, QGroupBox, QWidget)
 from PyQt5.QtCore import Qt
 
 class SettingsWindow(QDialog):
@@ -28,6 +28,7 @@ class SettingsWindow(QDialog):
         self.reminder_time_combo = QComboBox()
         self.reminder_times = {"5 minutes": 5, "10 minutes": 10, "15 minutes": 15, "30 minutes": 30}
         self.reminder_time_combo.addItems(self.reminder_times.keys())
+        self._reminder_text_by_minutes = {minutes: text for text, minutes in self.reminder_times.items()}
         form_layout.addRow("Remind Me Before Event:", self.reminder_time_combo)
 
         # Voice Selection (FR-SET-02)
@@ -38,12 +39,14 @@ class SettingsWindow(QDialog):
         else:
             self.voice_combo.addItem("No voices found")
             self.voice_combo.setEnabled(False)
+        self._voice_index_by_id = {voice.id: i for i, voice in enumerate(available_voices or [])}
         form_layout.addRow("Assistant Voice:", self.voice_combo)
 
         # Snooze Duration
         self.snooze_duration_combo = QComboBox()
         self.snooze_durations = {"2 minutes": 2, "5 minutes": 5, "10 minutes": 10, "15 minutes": 15}
         self.snooze_duration_combo.addItems(self.snooze_durations.keys())
+        self._snooze_text_by_minutes = {minutes: text for text, minutes in self.snooze_durations.items()}
         form_layout.addRow("Snooze Duration:", self.snooze_duration_combo)
 
         general_group.setLayout(form_layout)
@@ -89,26 +92,19 @@ class SettingsWindow(QDialog):
         self.name_edit.setText(settings.get("user_name", ""))
 
         # Set reminder time
-        reminder_minutes = settings.get("reminder_time", 15)
-        for text, minutes in self.reminder_times.items():
-            if minutes == reminder_minutes:
-                self.reminder_time_combo.setCurrentText(text)
-                break
+        reminder_text = self._reminder_text_by_minutes.get(settings.get("reminder_time", 15))
+        if reminder_text:
+            self.reminder_time_combo.setCurrentText(reminder_text)
 
         # Set voice
-        voice_id = settings.get("voice_id")
-        if voice_id and self.available_voices:
-            for i, voice in enumerate(self.available_voices):
-                if voice.id == voice_id:
-                    self.voice_combo.setCurrentIndex(i)
-                    break
+        voice_index = self._voice_index_by_id.get(settings.get("voice_id"))
+        if voice_index is not None:
+            self.voice_combo.setCurrentIndex(voice_index)
 
         # Set snooze duration
-        snooze_minutes = settings.get("snooze_duration", 5)
-        for text, minutes in self.snooze_durations.items():
-            if minutes == snooze_minutes:
-                self.snooze_duration_combo.setCurrentText(text)
-                    break
+        snooze_text = self._snooze_text_by_minutes.get(settings.get("snooze_duration", 5))
+        if snooze_text:
+            self.snooze_duration_combo.setCurrentText(snooze_text)
 
     def get_settings(self) -> dict:
         """Returns a dictionary of the current settings from the UI."""
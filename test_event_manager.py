@@ -73,5 +73,135 @@ class TestEventManager(unittest.TestCase):
         self.assertEqual(unified_events[2]['id'], 'z2') # 11:00
         self.assertEqual(unified_events[3]['id'], 'g2') # 14:00
 
+    @patch('src.core.event_manager.AuthManager')
+    @patch('src.core.event_manager.ZohoCalendarService')
+    @patch('src.core.event_manager.GoogleCalendarService')
+    def test_get_unified_events_keeps_events_when_one_provider_fails(
+        self, MockGoogleService, MockZohoService, MockAuthManager
+    ):
+        """
+        Tests that an exception raised by one calendar service does not drop
+        the events already fetched from the other.
+        """
+        MockAuthManager.get_token.return_value = 'dummy_token'
+
+        MockGoogleService.return_value.fetch_events.side_effect = RuntimeError("network down")
+        MockZohoService.return_value.fetch_events.return_value = [
+            {
+                'source': 'zoho', 'id': 'z1', 'title': 'Zoho Standup',
+                'start_time': '2023-10-27T09:00:00-07:00'
+            }
+        ]
+
+        event_manager = EventManager()
+        unified_events = event_manager.get_unified_events(datetime.datetime.now(), datetime.datetime.now())
+
+        self.assertEqual([e['id'] for e in unified_events], ['z1'])
+
+    @patch('src.core.event_manager.AuthManager')
+    @patch('src.core.event_manager.ZohoCalendarService')
+    @patch('src.core.event_manager.GoogleCalendarService')
+    def test_get_unified_events_drops_cross_provider_duplicates(
+        self, MockGoogleService, MockZohoService, MockAuthManager
+    ):
+        """
+        Tests that a meeting present in both calendars (same start time and
+        title, different IDs) is only returned once.
+        """
+        MockAuthManager.get_token.return_value = 'dummy_token'
+
+        MockGoogleService.return_value.fetch_events.return_value = [
+            {
+                'source': 'google', 'id': 'g1', 'title': 'Project Review',
+                'start_time': '2023-10-27T10:00:00-07:00'
+            }
+        ]
+        MockZohoService.return_value.fetch_events.return_value = [
+            {
+                'source': 'zoho', 'id': 'z1', 'title': ' project review ',
+                'start_time': '2023-10-27T10:00:00-07:00'
+            },
+            {
+                'source': 'zoho', 'id': 'z2', 'title': 'Project Review',
+                'start_time': '2023-10-27T15:00:00-07:00'
+            }
+        ]
+
+        event_manager = EventManager()
+        unified_events = event_manager.get_unified_events(datetime.datetime.now(), datetime.datetime.now())
+
+        self.assertEqual(len(unified_events), 2)
+        self.assertEqual(unified_events[1]['id'], 'z2')
+
+    @patch('src.core.event_manager.AuthManager')
+    @patch('src.core.event_manager.ZohoCalendarService')
+    @patch('src.core.event_manager.GoogleCalendarService')
+    def test_get_unified_events_keeps_similar_events_from_the_same_provider(
+        self, MockGoogleService, MockZohoService, MockAuthManager
+    ):
+        """
+        Tests that two distinct meetings from one calendar that start in the
+        same minute and share a title prefix are both kept, while an exact
+        repeat of one of them is still dropped.
+        """
+        MockAuthManager.get_token.return_value = 'dummy_token'
+
+        MockGoogleService.return_value.fetch_events.return_value = [
+            {
+                'source': 'google', 'id': 'g1', 'title': 'Interview - Candidate A',
+                'start_time': '2023-10-27T10:00:00-07:00'
+            },
+            {
+                'source': 'google', 'id': 'g2', 'title': 'Interview - Candidate B',
+                'start_time': '2023-10-27T10:00:00-07:00'
+            },
+            {
+                'source': 'google', 'id': 'g1', 'title': 'Interview - Candidate A',
+                'start_time': '2023-10-27T10:00:00-07:00'
+            }
+        ]
+        MockZohoService.return_value.fetch_events.return_value = []
+
+        event_manager = EventManager()
+        unified_events = event_manager.get_unified_events(datetime.datetime.now(), datetime.datetime.now())
+
+        self.assertEqual(sorted(e['id'] for e in unified_events), ['g1', 'g2'])
+
+    @patch('src.core.event_manager.AuthManager')
+    @patch('src.core.event_manager.ZohoCalendarService')
+    @patch('src.core.event_manager.GoogleCalendarService')
+    def test_get_unified_events_sorts_across_utc_offsets_and_all_day_events(
+        self, MockGoogleService, MockZohoService, MockAuthManager
+    ):
+        """
+        Tests that events are ordered by the instant they start even when their
+        timestamps use different UTC offsets, and that an all-day event (a bare
+        date, with no offset) can be sorted alongside timed ones.
+        """
+        MockAuthManager.get_token.return_value = 'dummy_token'
+
+        MockGoogleService.return_value.fetch_events.return_value = [
+            {
+                'source': 'google', 'id': 'g1', 'title': 'Late Call',
+                # 17:00 UTC, but sorts before '09:00Z' as a string
+                'start_time': '2023-10-27T10:00:00-07:00'
+            },
+            {
+                'source': 'google', 'id': 'g2', 'title': 'Offsite',
+                'start_time': '2023-10-20'
+            }
+        ]
+        MockZohoService.return_value.fetch_events.return_value = [
+            {
+                'source': 'zoho', 'id': 'z1', 'title': 'Early Call',
+                'start_time': '2023-10-27T09:00:00Z'
+            }
+        ]
+
+        event_manager = EventManager()
+        unified_events = event_manager.get_unified_events(datetime.datetime.now(), datetime.datetime.now())
+
+        self.assertEqual([e['id'] for e in unified_events], ['g2', 'z1', 'g1'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
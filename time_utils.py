@@ -0,0 +1,37 @@
+import datetime
+import functools
+import sys
+
+from dateutil import parser
+
+# fromisoformat only accepts the 'Z' suffix from Python 3.11 onwards.
+NEEDS_Z_REWRITE = sys.version_info < (3, 11)
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso(value: str) -> datetime.datetime:
+    """
+    Parses an ISO 8601 timestamp as returned by the calendar APIs.
+
+    datetime.fromisoformat is implemented in C and handles the well-formed strings
+    Google and Zoho normally emit; dateutil's pure-Python parser is only used as a
+    fallback for the odd format it rejects. Results are memoized, since each sync
+    mostly sees the same timestamps as the last one.
+
+    Args:
+        value (str): The timestamp, e.g. '2023-10-27T10:00:00Z' or '2023-10-27'.
+
+    Returns:
+        datetime.datetime: The parsed datetime.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp.
+        TypeError: If value is not a string.
+    """
+    if not isinstance(value, str):
+        raise TypeError(f"Expected an ISO 8601 string, got {type(value).__name__}")
+    if NEEDS_Z_REWRITE and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return parser.isoparse(value)
@@ -1,5 +1,22 @@
 from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
+
+# The context menu, top to bottom, as (attribute for the action, label); None is a separator
+MENU_ENTRIES = (
+    ("show_action", "Show Dashboard"),
+    ("sync_action", "Sync Now"),
+    None,
+    ("quit_action", "Quit"),
+)
+
+def _load_icon(icon_path: str) -> QIcon:
+    """Returns the icon at icon_path, decoding the image file only the first time it is used."""
+    key = f"chronoai.tray:{icon_path}"
+    pixmap = QPixmapCache.find(key) # None (or a null pixmap) on a miss
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(icon_path)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
 
 class TrayIcon(QSystemTrayIcon):
     """
@@ -10,31 +27,33 @@ class TrayIcon(QSystemTrayIcon):
         super().__init__(parent)
 
         # 1. Set the icon and tooltip
-        self.setIcon(QIcon(icon_path))
+        self.setIcon(_load_icon(icon_path))
         self.setToolTip("ChronoAI - Your Personal Calendar Assistant")
 
         # 2. Create the context menu
         self.menu = QMenu(parent)
 
-        # 3. Create the actions for the menu
-        self.show_action = QAction("Show Dashboard", self)
-        self.sync_action = QAction("Sync Now", self)
-        self.quit_action = QAction("Quit", self)
-
-        # 4. Add actions to the menu
-        self.menu.addAction(self.show_action)
-        self.menu.addAction(self.sync_action)
-        self.menu.addSeparator()
-        self.menu.addAction(self.quit_action)
-
-        # 5. Set the context menu for the tray icon
+        # 3. Create the menu's actions, owned by the menu, and add them in one call
+        actions = []
+        for entry in MENU_ENTRIES:
+            if entry is None:
+                action = QAction(self.menu)
+                action.setSeparator(True)
+            else:
+                attribute, label = entry
+                action = QAction(label, self.menu)
+                setattr(self, attribute, action)
+            actions.append(action)
+        self.menu.addActions(actions)
+
+        # 4. Set the context menu for the tray icon
         self.setContextMenu(self.menu)
 
         # The signals for these actions (e.g., self.show_action.triggered)
         # will be connected in the main application file where the main window
         # and other components are instantiated.
 
-        # 6. Make the icon visible
+        # 5. Make the icon visible
         self.show()
 
     def show_message(self, title: str, message: str, msecs: int = 2000):
@@ -1,102 +1,144 @@
+import functools
 import pyttsx3
+import queue
 import threading
-import time
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Most requests waiting to be spoken; beyond this the oldest pending one is dropped
+MAX_PENDING_REQUESTS = 4
+
+logger = logging.getLogger(__name__)
 
 class TTSEngine:
     """
     A thread-safe wrapper for the pyttsx3 text-to-speech engine.
-    This class manages a single instance of the TTS engine and handles speaking
-    tasks in a non-blocking manner, with support for stopping speech prematurely.
+    It handles speaking tasks in a non-blocking manner, with support for stopping
+    speech prematurely. Use get_tts_engine() to get the shared instance.
+
+    Speech requests are queued to one long-lived worker thread that speaks them in
+    order, so the engine's event loop is never driven from two threads at once.
 
     This addresses requirements FR-NOT-03 (volume control) and the technical
     need to interrupt speech for FR-NOT-06.
     """
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        # Singleton pattern to ensure only one engine instance exists.
-        if not cls._instance:
-            with cls._lock:
-                if not cls._instance:
-                    cls._instance = super(TTSEngine, cls).__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        # The __init__ might be called multiple times in a singleton,
-        # so we use a flag to ensure initialization happens only once.
-        if hasattr(self, '_initialized') and self._initialized:
-            return
+        # Guards _is_speaking, the only state shared between the worker and callers
+        self._lock = threading.Lock()
 
-        with self._lock:
-            if hasattr(self, '_initialized') and self._initialized:
-                return
-
-            logging.info("Initializing TTS Engine...")
-            try:
-                self.engine = pyttsx3.init()
-                self._initialized = True
-                self._is_speaking = False
-                self._speech_thread = None
-            except Exception as e:
-                logging.error(f"Failed to initialize pyttsx3 engine: {e}")
-                self._initialized = False
-                self.engine = None
-
-    def _speak_worker(self, text: str, volume: float):
+        logger.info("Initializing TTS Engine...")
+        try:
+            self.engine = pyttsx3.init()
+            self._is_speaking = False
+            self._queue = queue.Queue(maxsize=MAX_PENDING_REQUESTS)
+            self._worker = threading.Thread(target=self._speak_worker, name="TTSWorker", daemon=True)
+            self._worker.start()
+        except Exception as e:
+            logger.error("Failed to initialize pyttsx3 engine: %s", e)
+            self.engine = None
+
+    def _speak_worker(self):
         """
-        Internal worker function that runs the speech synthesis in a separate thread.
-        This prevents the main application from blocking.
+        Internal worker loop that runs the speech synthesis on its own thread for the
+        lifetime of the engine, speaking queued requests one at a time until it
+        receives the None sentinel from shutdown().
         """
-        if not self.engine:
-            logging.error("TTS engine not available. Cannot speak.")
-            return
-
-        try:
-            self.engine.setProperty('volume', max(0.0, min(1.0, volume)))
-            self.engine.say(text)
-            self.engine.runAndWait()
-        finally:
-            with self._lock:
-                self._is_speaking = False
+        # Bound once, since the worker runs for the lifetime of the engine
+        get_request, get_request_nowait = self._queue.get, self._queue.get_nowait
+        set_property, say, run_and_wait = self.engine.setProperty, self.engine.say, self.engine.runAndWait
+        lock = self._lock
+        running = True
+        while running:
+            requests = [get_request()]
+            # Take everything else already queued too, so a backlog is spoken in a
+            # single run of the engine's event loop rather than one run per request.
+            try:
+                while True:
+                    requests.append(get_request_nowait())
+            except queue.Empty:
+                pass
+            if None in requests:
+                running = False
+                requests = requests[:requests.index(None)]
+            if not requests:
+                continue
+
+            with lock:
+                self._is_speaking = True
+            try:
+                # The engine queues property changes in order with the utterances
+                for text, volume in requests:
+                    set_property('volume', max(0.0, min(1.0, volume)))
+                    say(text)
+                run_and_wait()
+            except Exception as e:
+                logger.error("TTS engine failed to speak: %s", e)
+            finally:
+                with lock:
+                    self._is_speaking = False
 
     def speak(self, text: str, volume: float = 1.0):
         """
-        Speaks the given text at the specified volume in a non-blocking manner.
+        Queues the given text to be spoken at the specified volume, without blocking.
+        Requests made while the engine is speaking are spoken after it finishes; if
+        MAX_PENDING_REQUESTS are already waiting, the oldest of them is dropped to
+        make room, so a burst of notifications can't pile up stale speech.
 
         Args:
             text (str): The text to be spoken.
             volume (float): The volume, from 0.0 (silent) to 1.0 (full).
         """
-        with self._lock:
-            if self._is_speaking:
-                logging.warning("TTS Engine is already speaking. New request ignored.")
-                return
+        if self.engine is None:
+            logger.error("Cannot speak, TTS Engine is not initialized.")
+            return
 
-            if not self._initialized or not self.engine:
-                logging.error("Cannot speak, TTS Engine is not initialized.")
+        request = (text, volume)
+        while True:
+            try:
+                self._queue.put_nowait(request)
                 return
-
-            self._is_speaking = True
-            self._speech_thread = threading.Thread(target=self._speak_worker, args=(text, volume))
-            self._speech_thread.start()
+            except queue.Full:
+                try:
+                    dropped, _ = self._queue.get_nowait()
+                    logger.warning("TTS queue full, dropping pending speech: %s", dropped)
+                except queue.Empty:
+                    pass # The worker took one in the meantime
 
     def stop(self):
         """
-        Stops the currently speaking audio immediately.
+        Stops the currently speaking audio immediately and discards any queued speech.
         """
+        if self.engine is None:
+            return
+
+        # Drop pending requests first so the worker doesn't move on to them
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
         with self._lock:
-            if not self._is_speaking or not self.engine:
+            if not self._is_speaking:
                 return
 
-            logging.info("Stopping current speech.")
+            logger.info("Stopping current speech.")
             # pyttsx3's stop command is thread-safe
             self.engine.stop()
-            self._is_speaking = False
 
-        # It's good practice to wait for the thread to finish
-        if self._speech_thread and self._speech_thread.is_alive():
-            self._speech_thread.join(timeout=1.0)
\ No newline at end of file
+    def shutdown(self):
+        """Stops any speech and ends the worker thread."""
+        if self.engine is None:
+            return
+
+        self.stop()
+        self._queue.put(None)
+        self._worker.join(timeout=0.5)
+
+@functools.cache
+def get_tts_engine() -> TTSEngine:
+    """
+    Returns the application's single TTS engine, creating it on the first call.
+    Initialization is only attempted once; a driver that failed to load won't
+    load on a second try either.
+    """
+    return TTSEngine()
\ No newline at end of file
@@ -1,11 +1,22 @@
 import datetime
+import inspect
+from functools import cached_property
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.services.auth_manager import AuthManager
+from src.services._util import attendee_emails, orjson
+
+logger = logging.getLogger(__name__)
 
 # --- Zoho Configuration ---
 # IMPORTANT: These must be replaced with your actual Client ID and Secret
@@ -14,16 +25,48 @@ ZOHO_CLIENT_ID = "YOUR_ZOHO_CLIENT_ID"
 ZOHO_CLIENT_SECRET = "YOUR_ZOHO_CLIENT_SECRET"
 
 # This is a placeholder. If your client ID is not set, the app will not work.
-if "YOUR_ZOHO" in ZOHO_CLIENT_ID:
-    logging.warning("Zoho Client ID and Secret are not set in zoho_cal.py. Zoho integration will not work.")
+ZOHO_CONFIGURED = "YOUR_ZOHO" not in ZOHO_CLIENT_ID
+if not ZOHO_CONFIGURED:
+    logger.warning("Zoho Client ID and Secret are not set in zoho_cal.py. Zoho integration will not work.")
 
 ACCOUNT_NAME = 'zoho'
+ACCESS_TOKEN_ACCOUNT = f'{ACCOUNT_NAME}:access' # The short-lived access token and its expiry, as JSON
 SCOPES = "ZohoCalendar.events.READ,ZohoCalendar.calendars.READ"
 
 # Zoho API Endpoints
 ACCOUNTS_URL = "https://accounts.zoho.com" # Or .eu, .in, etc.
 TOKEN_URL = f"{ACCOUNTS_URL}/oauth/v2/token"
 API_BASE_URL = "https://calendar.zoho.com/api/v1"
+REQUEST_TIMEOUT = (3.05, 15) # (connect, read) seconds, so a hung endpoint can't stall a sync
+TOKEN_EXPIRY_MARGIN = 60 # Seconds before its stated expiry an access token is renewed
+MAX_FETCH_WORKERS = 8 # Calendars fetched at once; matches the connection pool size
+CALENDAR_LIST_TTL = 600 # Seconds the user's calendar list is reused before it's fetched again
+MAX_RETRY_AFTER = 5 # Longest wait, in seconds, honoured from a Retry-After header
+
+def _json(response: requests.Response) -> Any:
+    """Decodes a response body as JSON, with orjson when it is installed."""
+    if orjson:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass # Let requests raise its usual error for a malformed body
+    return response.json()
+
+def _zoho_time(value: datetime.datetime) -> str:
+    """Formats a datetime as the UTC 'YYYY-MM-DDTHH:MM:SSZ' timestamp the Zoho API expects."""
+    # astimezone() treats naive values as local time
+    utc_value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return f"{utc_value.isoformat(timespec='seconds')}Z"
+
+class _CappedRetry(Retry):
+    """A Retry policy that never sleeps longer than MAX_RETRY_AFTER for a Retry-After header."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+# urllib3 2.x can randomize the backoff, so clients don't retry in lockstep; 1.x can't
+_RETRY_JITTER = {'backoff_jitter': 0.3} if 'backoff_jitter' in inspect.signature(Retry).parameters else {}
 
 class ZohoCalendarService:
     """
@@ -33,6 +76,39 @@ class ZohoCalendarService:
 
     def __init__(self):
         self.access_token: Optional[str] = None
+        self._token_expires_at = 0.0 # time.time() deadline for access_token; it's persisted
+        self._token_lock = threading.Lock() # Held while the access token is loaded or refreshed
+        # Bumped by disconnect(), which runs on the GUI thread and so mustn't wait for
+        # _token_lock; a refresh started under an older generation is thrown away.
+        # _state_lock is only held briefly, to make that check and the save atomic.
+        self._generation = 0
+        self._state_lock = threading.Lock()
+        # (time.monotonic() when listed, calendars); the list rarely changes between syncs
+        self._calendars_cache: Optional[Tuple[float, List[Dict]]] = None
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        """
+        The one pooled session used for every call, so syncs reuse open TLS connections.
+        It's built on first use, so an account that is never connected costs nothing.
+        """
+        # Rate limiting and transient server errors are retried per request with
+        # exponential backoff (honouring a short Retry-After), so one calendar's hiccup
+        # doesn't fail the whole sync. Token refreshes are safe to repeat, so POSTs retry
+        # too; the one-time grant code exchange doesn't go through this session. The
+        # final response is returned rather than raised, for raise_for_status().
+        session = requests.Session()
+        retry = _CappedRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **_RETRY_JITTER
+        )
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        return session
 
     def _get_access_token(self) -> Optional[str]:
         """
@@ -40,48 +116,100 @@ class ZohoCalendarService:
         It uses a stored refresh token to get a new access token.
         If no refresh token exists, it guides the user through the initial auth flow.
         """
-        if self.access_token:
+        # Renew shortly before the token expires rather than waiting for a 401
+        if self.access_token and time.time() < self._token_expires_at:
             return self.access_token
+        # Without real client credentials every token request would be refused
+        if not ZOHO_CONFIGURED:
+            return None
 
-        refresh_token = AuthManager.get_token(ACCOUNT_NAME)
+        # Only one thread refreshes at a time; the rest wait here and reuse its token,
+        # since a concurrent refresh would waste a round-trip or trip Zoho's limits.
+        with self._token_lock:
+            # A token from an earlier run is still good for up to an hour after it was issued
+            if not self.access_token:
+                self._restore_access_token()
+            # Another thread may have refreshed it while this one waited
+            if self.access_token and time.time() < self._token_expires_at:
+                return self.access_token
+
+            generation = self._generation
+            refresh_token = AuthManager.get_token(ACCOUNT_NAME)
 
-        if not refresh_token:
-            logging.info("No Zoho refresh token found. Starting initial authentication.")
-            refresh_token = self._initiate_auth_flow()
             if not refresh_token:
+                logger.info("No Zoho refresh token found. Starting initial authentication.")
+                refresh_token = self._initiate_auth_flow()
+                if not refresh_token:
+                    return None
+                AuthManager.save_token(ACCOUNT_NAME, refresh_token)
+
+            # We have a refresh token, so let's get a new access token
+            try:
+                response = self._session.post(TOKEN_URL, params={
+                    'refresh_token': refresh_token,
+                    'client_id': ZOHO_CLIENT_ID,
+                    'client_secret': ZOHO_CLIENT_SECRET,
+                    'grant_type': 'refresh_token'
+                }, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                token_data = _json(response)
+                expires_at = time.time() + token_data.get('expires_in', 3600) - TOKEN_EXPIRY_MARGIN
+                with self._state_lock:
+                    if generation != self._generation:
+                        logger.info("Zoho account was disconnected during a token refresh; discarding the token.")
+                        return None
+                    self._set_access_token(token_data['access_token'], expires_at)
+                    AuthManager.save_token(ACCESS_TOKEN_ACCOUNT, json.dumps({
+                        'access_token': token_data['access_token'],
+                        'expires_at': expires_at
+                    }))
+                logger.info("Successfully refreshed Zoho access token.")
+                return token_data['access_token']
+            except requests.exceptions.RequestException as e:
+                logger.error("Error refreshing Zoho access token: %s", e)
+                # A 4xx Response is falsy, so it must be compared against None
+                if e.response is not None and e.response.status_code in [400, 401]:
+                    logger.error("Zoho refresh token might be invalid. Please try disconnecting and reconnecting.")
+                    AuthManager.delete_token(ACCOUNT_NAME)
                 return None
-            AuthManager.save_token(ACCOUNT_NAME, refresh_token)
 
-        # We have a refresh token, so let's get a new access token
+    def _set_access_token(self, token: str, expires_at: float):
+        """Makes token the access token used for API calls until expires_at (a time.time() value)."""
+        self.access_token = token
+        self._token_expires_at = expires_at
+
+    def _restore_access_token(self):
+        """Loads the access token saved by an earlier refresh, if there is one."""
+        stored = AuthManager.get_token(ACCESS_TOKEN_ACCOUNT)
+        if not stored:
+            return
         try:
-            response = requests.post(TOKEN_URL, params={
-                'refresh_token': refresh_token,
-                'client_id': ZOHO_CLIENT_ID,
-                'client_secret': ZOHO_CLIENT_SECRET,
-                'grant_type': 'refresh_token'
-            })
-            response.raise_for_status()
-            token_data = response.json()
-            self.access_token = token_data['access_token']
-            logging.info("Successfully refreshed Zoho access token.")
-            return self.access_token
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error refreshing Zoho access token: {e}")
-            if e.response and e.response.status_code in [400, 401]:
-                logging.error("Zoho refresh token might be invalid. Please try disconnecting and reconnecting.")
-                AuthManager.delete_token(ACCOUNT_NAME)
-            return None
+            token_data = json.loads(stored)
+            self._set_access_token(token_data['access_token'], float(token_data['expires_at']))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable stored Zoho access token: %s", e)
+
+    def _invalidate_access_token(self):
+        """Forgets the current access token, including the stored copy, so the next call refreshes it."""
+        self.access_token = None
+        self._token_expires_at = 0.0
+        AuthManager.delete_token(ACCESS_TOKEN_ACCOUNT)
 
     def _initiate_auth_flow(self) -> Optional[str]:
         """
         Guides the user through the one-time manual process of getting a grant token
         and exchanging it for a refresh token.
         """
-        if "YOUR_ZOHO" in ZOHO_CLIENT_ID:
-            logging.error("Cannot initiate Zoho auth flow. Client ID/Secret not configured.")
+        if not ZOHO_CONFIGURED:
+            logger.error("Cannot initiate Zoho auth flow. Client ID/Secret not configured.")
             return None
 
-        auth_url = f"{ACCOUNTS_URL}/oauth/v2/auth?scope={SCOPES}&client_id={ZOHO_CLIENT_ID}&response_type=code&access_type=offline"
+        auth_url = f"{ACCOUNTS_URL}/oauth/v2/auth?" + urlencode({
+            'scope': SCOPES,
+            'client_id': ZOHO_CLIENT_ID,
+            'response_type': 'code',
+            'access_type': 'offline'
+        })
         print("--- Zoho First-Time Setup ---")
         print(f"1. Open this URL in your browser:\n{auth_url}")
         print("2. Grant access to your account.")
@@ -89,76 +217,175 @@ class ZohoCalendarService:
         grant_token = input("4. Paste the 'code' here and press Enter: ").strip()
 
         if not grant_token:
-            logging.error("No grant token provided. Zoho authentication cancelled.")
+            logger.error("No grant token provided. Zoho authentication cancelled.")
             return None
 
         try:
+            # Not through the retrying session: the code is single-use, so a repeat
+            # would fail with invalid_code and hide the real error.
             response = requests.post(TOKEN_URL, params={
                 'code': grant_token,
                 'client_id': ZOHO_CLIENT_ID,
                 'client_secret': ZOHO_CLIENT_SECRET,
                 'grant_type': 'authorization_code'
-            })
+            }, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            token_data = response.json()
-            logging.info("Successfully obtained Zoho refresh token.")
+            token_data = _json(response)
+            logger.info("Successfully obtained Zoho refresh token.")
             return token_data['refresh_token']
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error exchanging Zoho grant token: {e}")
+            logger.error("Error exchanging Zoho grant token: %s", e)
             return None
 
     def fetch_events(self, start_date: datetime.datetime, end_date: datetime.datetime) -> List[Dict[str, Any]]:
         """Fetches events from the user's Zoho calendars."""
-        access_token = self._get_access_token()
-        if not access_token:
-            logging.error("Cannot fetch Zoho events: Authentication failed.")
+        try:
+            all_events = list(self.iter_events(start_date, end_date))
+        except requests.exceptions.RequestException as e:
+            logger.error("An error occurred while fetching Zoho events: %s", e)
             return []
 
-        headers = {'Authorization': f'Zoho-oauthtoken {access_token}'}
-        
-        # Zoho API requires time in a specific format with 'T' and 'Z'
-        time_format = "%Y-%m-%dT%H:%M:%SZ"
-        params = {
-            'from': start_date.strftime(time_format),
-            'to': end_date.strftime(time_format)
-        }
+        logger.info("Found %s total events in Zoho Calendar.", len(all_events))
+        return all_events
 
-        try:
-            # First, get the list of calendars
-            cal_response = requests.get(f"{API_BASE_URL}/calendars", headers=headers)
-            cal_response.raise_for_status()
-            calendars = cal_response.json().get('calendars', [])
-
-            all_events = []
-            for calendar in calendars:
-                cal_uid = calendar['uid']
-                events_url = f"{API_BASE_URL}/calendars/{cal_uid}/events"
-                events_response = requests.get(events_url, headers=headers, params=params)
-                events_response.raise_for_status()
-                events = events_response.json().get('events', [])
-                all_events.extend([self._parse_event(e) for e in events])
-            
-            logging.info(f"Found {len(all_events)} total events in Zoho Calendar.")
-            return all_events
+    def iter_events(self, start_date: datetime.datetime, end_date: datetime.datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Yields events from the user's Zoho calendars as each calendar's response
+        arrives, so a caller can start on the first calendar's events while the
+        others are still in flight, and never holds more than it keeps.
 
-        except requests.exceptions.RequestException as e:
-            logging.error(f"An error occurred while fetching Zoho events: {e}")
+        Raises:
+            requests.exceptions.RequestException: If listing the calendars or fetching
+                one of them fails.
+        """
+        if not self._get_access_token():
+            logger.error("Cannot fetch Zoho events: Authentication failed.")
+            return
+
+        # Encoded once; every calendar's request shares the same window
+        query = urlencode({
+            'from': _zoho_time(start_date),
+            'to': _zoho_time(end_date)
+        })
+        events_urls = [f"{API_BASE_URL}/calendars/{calendar['uid']}/events?{query}"
+                       for calendar in self._list_calendars()]
+        parse_event = self._parse_event
+
+        if len(events_urls) == 1:
+            # The usual single-calendar account is fetched right here, without a pool
+            yield from map(parse_event, self._get_calendar_events(events_urls[0]))
+        elif events_urls:
+            # Each calendar is its own request, so workers issue them concurrently over
+            # the pooled session and the slowest calendar bounds the whole fetch.
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(events_urls))) as executor:
+                futures = [executor.submit(self._get_calendar_events, url) for url in events_urls]
+                try:
+                    for future in as_completed(futures):
+                        yield from map(parse_event, future.result())
+                finally:
+                    # If the caller stops early, don't start the requests still queued
+                    for future in futures:
+                        future.cancel()
+
+    def _list_calendars(self) -> List[Dict]:
+        """
+        Returns the user's calendars, reusing the list fetched within the last
+        CALENDAR_LIST_TTL seconds.
+
+        Raises:
+            requests.exceptions.RequestException: If the list has to be fetched and that fails.
+        """
+        cached = self._calendars_cache
+        if cached and time.monotonic() - cached[0] < CALENDAR_LIST_TTL:
+            return cached[1]
+        calendars = self._api_get(f"{API_BASE_URL}/calendars").get('calendars', [])
+        self._calendars_cache = (time.monotonic(), calendars)
+        return calendars
+
+    def _get_calendar_events(self, events_url: str) -> List[Dict]:
+        """
+        Returns the raw events at a calendar's events URL. A calendar deleted since the
+        calendar list was cached answers 404/410; it's skipped, and the cache dropped so
+        the next fetch lists the calendars again.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails for any other reason.
+        """
+        try:
+            return self._api_get(events_url).get('events', [])
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code not in (404, 410):
+                raise
+            logger.warning("Zoho calendar no longer exists, skipping it: %s", events_url)
+            self._calendars_cache = None
             return []
 
-    def _parse_event(self, event: Dict) -> Dict[str, Any]:
+    def connect(self) -> bool:
+        """
+        Connects the account, running the console grant-code flow if there is no stored
+        refresh token. Blocks until the user finishes, so call it off the GUI thread.
+
+        Returns:
+            bool: Whether the account is now connected.
+        """
+        return self._get_access_token() is not None
+
+    def _api_get(self, url: str) -> Dict[str, Any]:
+        """
+        GETs a Zoho API URL with the current access token and returns the decoded body.
+        If Zoho rejects the token anyway (e.g. it was revoked), it is renewed and the
+        request retried once. The token goes in each request's own headers: calendar
+        workers share the session, and a refresh in one mustn't change another's request.
+
+        Raises:
+            requests.exceptions.RequestException: If the request ultimately fails.
+        """
+        token = self._get_access_token()
+        for attempt in range(2):
+            headers = {'Authorization': f'Zoho-oauthtoken {token}'}
+            response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 401 or attempt:
+                break
+            with self._token_lock:
+                # Concurrent calendar fetches can all be rejected at once; only the
+                # first drops the token, the others pick up the one it refreshes.
+                if self.access_token == token:
+                    self._invalidate_access_token()
+            token = self._get_access_token()
+            if not token:
+                break
+        response.raise_for_status()
+        return _json(response)
+
+    @staticmethod
+    def _parse_event(event: Dict) -> Dict[str, Any]:
         """Converts a Zoho Calendar API event object into our standard format."""
+        get = event.get
         return {
             'source': 'zoho',
             'id': event['uid'],
-            'title': event.get('title', 'No Title'),
-            'start_time': event.get('starttime'), # Zoho provides ISO 8601 format
-            'end_time': event.get('endtime'),
-            'attendees': [att['email'] for att in event.get('attendees', []) if 'email' in att],
-            'location': event.get('location', None)
+            'title': get('title', 'No Title'),
+            'start_time': get('starttime'), # Zoho provides ISO 8601 format
+            'end_time': get('endtime'),
+            'attendees': attendee_emails(get('attendees', ())),
+            'location': get('location', None)
         }
 
-    @staticmethod
-    def disconnect():
-        """Deletes the stored refresh token for Zoho Calendar."""
-        logging.info("Disconnecting Zoho Calendar account.")
-        AuthManager.delete_token(ACCOUNT_NAME)
\ No newline at end of file
+    def close(self):
+        """Closes the pooled connections. The service stays usable; it just reconnects."""
+        if '_session' in self.__dict__: # Nothing to close if it was never used
+            self._session.close()
+
+    def disconnect(self):
+        """
+        Deletes the stored refresh token for Zoho Calendar and closes open connections.
+        It never waits for a token refresh in progress; that refresh discards its token.
+        """
+        logger.info("Disconnecting Zoho Calendar account.")
+        AuthManager.delete_token(ACCOUNT_NAME)
+        with self._state_lock:
+            self._generation += 1
+            self._invalidate_access_token()
+        self._calendars_cache = None # The next account may have different calendars
+        # A closed session can still be used; it just opens new connections
+        self.close()
\ No newline at end of file